@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark serial vs parallel file scanning for reference graph builds.
+
+Generates a synthetic workspace (10,000 documents by default) and times full
+builds of the reference edges with different worker counts. Use --open-latency-ms
+to simulate the per-file open latency of a network-mounted home directory.
+
+Usage:
+    python benchmarks/bench_reference_graph.py [--files 10000] [--workers 1 4 8 16] [--open-latency-ms 0]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import tools.reference_graph as reference_graph
+from tools.reference_graph import build_reference_edges, collect_all_filenames
+
+
+PREFIXES = {"design_logs": "dl", "operations": "op", "artifacts": "art"}
+TOPICS = ["auth", "database", "cache", "api", "billing", "search", "deploy", "metrics"]
+
+
+def create_workspace(root: str, file_count: int, seed: int = 42) -> str:
+    """Create a synthetic .assistant workspace with cross-referencing documents."""
+    rng = random.Random(seed)
+    assistant_dir = os.path.join(root, ".assistant")
+
+    names = []
+    for number in range(1, file_count + 1):
+        dir_name = rng.choice(list(PREFIXES))
+        names.append((dir_name, f"{PREFIXES[dir_name]}_{number}_{rng.choice(TOPICS)}.md"))
+
+    for dir_name in PREFIXES:
+        os.makedirs(os.path.join(assistant_dir, dir_name))
+
+    filler = "Lorem ipsum dolor sit amet, consectetur adipiscing elit.\n" * 20
+    for dir_name, filename in names:
+        referenced = rng.sample(names, k=rng.randint(0, 6))
+        body = "".join(f"- See `{name}` for details.\n" for _, name in referenced)
+        with open(os.path.join(assistant_dir, dir_name, filename), 'w', encoding='utf-8') as f:
+            f.write(f"# {filename}\n\n{filler}\n## References\n\n{body}")
+
+    return assistant_dir
+
+
+def simulate_open_latency(latency_ms: float) -> None:
+    """Delay every file read by the given latency, as a slow network mount would."""
+    read_scan_content = reference_graph.read_scan_content
+
+    def delayed_read(file_path: str):
+        time.sleep(latency_ms / 1000)
+        return read_scan_content(file_path)
+
+    reference_graph.read_scan_content = delayed_read
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=10000, help="Number of documents to generate")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8, 16], help="Worker counts to compare")
+    parser.add_argument("--open-latency-ms", type=float, default=0.0, help="Simulated latency per file read")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per worker count (best time is reported)")
+    args = parser.parse_args()
+
+    temp_dir = tempfile.mkdtemp(prefix="glyph_bench_")
+    try:
+        print(f"Generating {args.files} documents in {temp_dir} ...")
+        assistant_dir = create_workspace(temp_dir, args.files)
+        all_filenames = collect_all_filenames(assistant_dir)
+
+        if args.open_latency_ms:
+            simulate_open_latency(args.open_latency_ms)
+            print(f"Simulating {args.open_latency_ms} ms open latency per file")
+
+        baseline_edges = None
+        print(f"\n{'workers':>8} | {'best (s)':>9} | {'speedup':>7} | {'edges':>7}")
+        print("-" * 42)
+
+        serial_time = None
+        for workers in args.workers:
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                # No previous manifest: every file is read and scanned
+                scan = build_reference_edges(assistant_dir, all_filenames, None, max_workers=workers)
+                timings.append(time.perf_counter() - start)
+
+            if baseline_edges is None:
+                baseline_edges = scan.edges
+            elif scan.edges != baseline_edges:
+                print(f"ERROR: edge order with {workers} workers differs from the first run")
+                sys.exit(1)
+
+            best = min(timings)
+            serial_time = serial_time or best
+            print(f"{workers:>8} | {best:>9.3f} | {serial_time / best:>6.2f}x | {len(scan.edges):>7}")
+
+        print("\nEdge lists are identical across all worker counts.")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Packed asset bundle: the whole assets/ tree in a single memory-mappable file.
+
+Layout (little endian):
+    8 bytes   magic b"GLYPHAB1"
+    8 bytes   length N of the index
+    N bytes   UTF-8 JSON index: {relative_path: [offset, length]}, paths with '/' separators
+    ...       file contents; offsets are relative to the end of the index
+
+Contents are stored as read in text mode (newlines normalized, UTF-8), so serving an asset
+from the bundle returns exactly what reading the loose file would.
+
+Build the bundle at deploy time with:
+    python src/asset_bundle.py [--assets-dir assets] [--output assets.bundle]
+and point GLYPH_ASSET_BUNDLE at it; without that variable the server reads the assets directory.
+"""
+import argparse
+import json
+import mmap
+import os
+import struct
+
+
+BUNDLE_MAGIC = b"GLYPHAB1"
+HEADER = struct.Struct("<8sQ")
+
+
+class AssetBundle:
+    """Read-only view of a packed asset bundle, backed by mmap."""
+    
+    def __init__(self, bundle_path: str):
+        """
+        Open and validate a bundle.
+        
+        Args:
+            bundle_path: Path to the bundle file.
+        
+        Raises:
+            ValueError: If the file is not a valid bundle.
+        """
+        self.path = bundle_path
+        with open(bundle_path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        if len(self._mmap) < HEADER.size:
+            raise ValueError(f"Not an asset bundle: {bundle_path}")
+        magic, index_length = HEADER.unpack_from(self._mmap, 0)
+        if magic != BUNDLE_MAGIC:
+            raise ValueError(f"Not an asset bundle: {bundle_path}")
+        
+        index_end = HEADER.size + index_length
+        self.entries: dict[str, tuple[int, int]] = {
+            rel_path: (index_end + offset, length)
+            for rel_path, (offset, length) in json.loads(self._mmap[HEADER.size:index_end].decode('utf-8')).items()
+        }
+        
+        # filename -> relative paths, in packing (walk) order
+        self.by_filename: dict[str, list[str]] = {}
+        for rel_path in self.entries:
+            self.by_filename.setdefault(rel_path.rsplit('/', 1)[-1], []).append(rel_path)
+    
+    def __contains__(self, rel_path: str) -> bool:
+        return rel_path in self.entries
+    
+    def view(self, rel_path: str) -> memoryview:
+        """
+        Get a zero-copy view of an asset's UTF-8 bytes.
+        
+        Args:
+            rel_path: Path relative to the assets directory, with '/' separators.
+        
+        Returns:
+            A memoryview slice of the mapped bundle.
+        """
+        offset, length = self.entries[rel_path]
+        return memoryview(self._mmap)[offset:offset + length]
+    
+    def read(self, rel_path: str) -> str:
+        """
+        Decode an asset straight from the mapped bundle.
+        
+        Args:
+            rel_path: Path relative to the assets directory, with '/' separators.
+        
+        Returns:
+            The asset content.
+        """
+        return str(self.view(rel_path), 'utf-8')
+
+
+def pack_assets(assets_dir: str, output_path: str) -> int:
+    """
+    Pack every file of an assets directory into a bundle.
+    
+    The bundle is written to a temporary file and renamed into place, so running servers
+    never see a partially written bundle.
+    
+    Args:
+        assets_dir: Path to the assets directory.
+        output_path: Path of the bundle to write.
+    
+    Returns:
+        Number of packed files.
+    """
+    contents: list[tuple[str, bytes]] = []
+    for root, dirs, files in os.walk(assets_dir):
+        dirs.sort()
+        for filename in sorted(files):
+            file_path = os.path.join(root, filename)
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = f.read().encode('utf-8')
+            rel_path = os.path.relpath(file_path, assets_dir).replace(os.sep, '/')
+            contents.append((rel_path, data))
+    
+    index = {}
+    offset = 0
+    for rel_path, data in contents:
+        index[rel_path] = [offset, len(data)]
+        offset += len(data)
+    index_bytes = json.dumps(index).encode('utf-8')
+    
+    temp_path = f"{output_path}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(HEADER.pack(BUNDLE_MAGIC, len(index_bytes)))
+        f.write(index_bytes)
+        for _, data in contents:
+            f.write(data)
+    os.replace(temp_path, output_path)
+    
+    return len(contents)
+
+
+if __name__ == "__main__":
+    repo_root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+    
+    parser = argparse.ArgumentParser(description="Pack the assets directory into a single memory-mappable bundle.")
+    parser.add_argument("--assets-dir", default=os.path.join(repo_root, "assets"), help="Assets directory to pack")
+    parser.add_argument("--output", default=os.path.join(repo_root, "assets.bundle"), help="Bundle file to write")
+    args = parser.parse_args()
+    
+    count = pack_assets(args.assets_dir, args.output)
+    print(f"Packed {count} assets into {os.path.normpath(args.output)}")
@@ -1 +1,112 @@
-BASE_NAME: str = ".assistant"
\ No newline at end of file
+import os
+import sys
+from typing import Callable, TypeVar
+
+_Number = TypeVar("_Number", int, float)
+
+
+def _env_number(
+    name: str,
+    default: _Number,
+    parse: Callable[[str], _Number] = int,
+    minimum: _Number | None = None,
+    positive: bool = False
+) -> _Number:
+    """
+    Read a numeric setting from the environment, falling back to the default on an invalid value.
+    
+    A typo in a variable must not keep the server from starting, so the bad value is reported on
+    stderr (stdout carries the MCP protocol) and the default is used instead.
+    
+    Args:
+        name: Name of the environment variable.
+        default: Value used when the variable is unset or invalid.
+        parse: Conversion of the variable's text (int or float).
+        minimum: Smallest accepted value, if any.
+        positive: If True, only values > 0 are accepted.
+    
+    Returns:
+        The parsed value, or the default.
+    """
+    raw = os.environ.get(name)
+    if raw is None or not raw.strip():
+        return default
+    
+    try:
+        value = parse(raw)
+    except ValueError:
+        print(f"Glyph: ignoring {name}={raw!r}, not a valid {parse.__name__}; using {default}", file=sys.stderr)
+        return default
+    
+    if minimum is not None and value < minimum:
+        print(f"Glyph: ignoring {name}={raw!r}, must be >= {minimum}; using {default}", file=sys.stderr)
+        return default
+    
+    if positive and value <= 0:
+        print(f"Glyph: ignoring {name}={raw!r}, must be > 0; using {default}", file=sys.stderr)
+        return default
+    
+    return value
+
+
+def _env_choice(name: str, default: str, choices: tuple[str, ...]) -> str:
+    """
+    Read a setting that takes one of a few names from the environment (case-insensitive).
+    
+    Like _env_number, an unknown value is reported on stderr and the default is used instead.
+    
+    Args:
+        name: Name of the environment variable.
+        default: Value used when the variable is unset or invalid.
+        choices: The accepted values, in lower case.
+    
+    Returns:
+        The chosen value, or the default.
+    """
+    raw = os.environ.get(name)
+    if raw is None or not raw.strip():
+        return default
+    
+    value = raw.strip().lower()
+    if value not in choices:
+        print(f"Glyph: ignoring {name}={raw!r}, must be one of {', '.join(choices)}; using {default}", file=sys.stderr)
+        return default
+    
+    return value
+
+
+BASE_NAME: str = ".assistant"
+
+# Threads used to read and scan files when rebuilding the reference graph (1 = serial)
+REFERENCE_SCAN_WORKERS: int = _env_number("GLYPH_REFERENCE_SCAN_WORKERS", 1, minimum=1)
+
+# Where the reference graph is stored: "csv" (reference_graph.csv + manifest, rewritten on every update)
+# or "sqlite" (reference_graph.db, updated incrementally; CSV/Mermaid exported on demand)
+REFERENCE_GRAPH_BACKEND: str = _env_choice("GLYPH_REFERENCE_GRAPH_BACKEND", "csv", ("csv", "sqlite"))
+
+# Project roots whose reference graph is kept live by a background watcher from server start
+# (separated by os.pathsep); watchers can also be started at runtime with watch_reference_graph
+REFERENCE_WATCH_PATHS: list[str] = [
+    path for path in os.environ.get("GLYPH_WATCH_PATHS", "").split(os.pathsep) if path
+]
+
+# Seconds between two polls of a watched workspace, and quiet time required before rebuilding
+REFERENCE_WATCH_POLL_INTERVAL: float = _env_number("GLYPH_WATCH_POLL_INTERVAL", 1.0, float, positive=True)
+REFERENCE_WATCH_DEBOUNCE: float = _env_number("GLYPH_WATCH_DEBOUNCE", 0.5, float, minimum=0.0)
+
+# Store persisted artifacts once in a content-addressed blob store (.assistant/blobs) and make
+# art_N_* files hard links to the blobs, so persisting the same content again takes no extra space
+ARTIFACT_DEDUP: bool = os.environ.get("GLYPH_ARTIFACT_DEDUP", "").lower() in ("1", "true", "yes")
+
+# Threads copying files in persist_artifacts (1 = serial)
+PERSIST_WORKERS: int = _env_number("GLYPH_PERSIST_WORKERS", 1, minimum=1)
+
+# Worker processes parsing files in static_code_analysis (1 = parse in the server process)
+CODE_ANALYSIS_WORKERS: int = _env_number("GLYPH_CODE_ANALYSIS_WORKERS", 1, minimum=1)
+
+# Maximum total size of asset files (prompts, rules, templates, examples) cached in memory
+ASSET_CACHE_MAX_BYTES: int = _env_number("GLYPH_ASSET_CACHE_MAX_BYTES", 8 * 1024 * 1024, minimum=0)
+
+# Packed asset bundle built by src/asset_bundle.py, served instead of the loose assets directory;
+# unset or empty to read the assets directory (the bundle is not compared with it, rebuild it on deploy)
+ASSET_BUNDLE_PATH: str | None = os.environ.get("GLYPH_ASSET_BUNDLE") or None
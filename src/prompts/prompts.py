@@ -3,38 +3,92 @@ Consolidated prompts module.
 
 All Glyph prompts (slash commands) in one place.
 """
+import re
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, List, Literal
 from mcp_object import mcp
 from read_an_asset import read_asset
 
 
-def replace_in_prompts(prompt: str, replacements_dict: Dict[str, Any]) -> str:
+@dataclass(frozen=True)
+class CompiledPrompt:
+    """A prompt template split into literal text and placeholder segments."""
+    # Literal text at even indices, placeholder names at odd indices
+    segments: tuple[str, ...]
+
+    def render(self, replacements_dict: Dict[str, Any]) -> str:
+        """
+        Fill the placeholders in a single join.
+
+        Args:
+            replacements_dict: A dictionary mapping placeholders to their replacements
+
+        Returns:
+            The rendered prompt
+        """
+        parts = list(self.segments)
+        for i in range(1, len(parts), 2):
+            parts[i] = str(replacements_dict[parts[i]])
+        return "".join(parts)
+
+
+@lru_cache(maxsize=128)
+def compile_prompt(prompt: str, placeholders: tuple[str, ...]) -> CompiledPrompt:
     """
-    Replace placeholders in a prompt string based on a replacements dictionary.
+    Compile a prompt template for the given placeholder names (cached per template and names).
+
+    Only the given names are searched for, so other braces of the template (placeholders not in
+    `placeholders`, or stray and unbalanced braces) are kept as literal text. The "Placeholder not
+    found" warnings for names missing from the template are rendered into the compiled prompt once, here.
 
     Args:
         prompt: The original prompt string with placeholders
-        replacements_dict: A dictionary mapping placeholders to their replacements
+        placeholders: The placeholder names that will be replaced, in order
 
     Returns:
-        The prompt string with placeholders replaced
+        The compiled prompt
     """
-    warnings: List[str] = []
+    segments: List[str] = []
+    found = set()
+    position = 0
 
-    for k, v in replacements_dict.items():
-        this = "{{" + k + "}}"
-        that = str(v)
+    # At a given position the alternation takes the first name that matches: try the longest first
+    names = sorted(set(placeholders), key=len, reverse=True)
+    pattern = re.compile("|".join(re.escape("{{" + name + "}}") for name in names)) if names else None
 
-        if this not in prompt:
-            warnings.append(f"Placeholder {this} not found in prompt.")
-            continue
-        
-        prompt = prompt.replace(this, that)
-    
+    for match in pattern.finditer(prompt) if pattern else ():
+        name = match.group()[2:-2]
+        segments.append(prompt[position:match.start()])
+        segments.append(name)
+        found.add(name)
+        position = match.end()
+
+    tail = prompt[position:]
+
+    warnings = [f"Placeholder {{{{{name}}}}} not found in prompt." for name in placeholders if name not in found]
     if warnings:
-        prompt += "\n\n-----WARNING:\n\n" + "\n".join(warnings)
+        tail += "\n\n-----WARNING:\n\n" + "\n".join(warnings)
 
-    return prompt
+    segments.append(tail)
+    return CompiledPrompt(tuple(segments))
+
+
+def replace_in_prompts(prompt: str, replacements_dict: Dict[str, Any]) -> str:
+    """
+    Replace placeholders in a prompt string based on a replacements dictionary.
+
+    The template is compiled once per set of placeholder names (see compile_prompt), so rendering
+    is a single join over the cached segments.
+
+    Args:
+        prompt: The original prompt string with placeholders
+        replacements_dict: A dictionary mapping placeholders to their replacements
+
+    Returns:
+        The prompt string with placeholders replaced
+    """
+    return compile_prompt(prompt, tuple(replacements_dict)).render(replacements_dict)
 
 
 def _normalize_number(value: int | float | str) -> str:
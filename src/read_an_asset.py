@@ -1,4 +1,10 @@
+import io
 import os
+import threading
+from collections import OrderedDict
+from typing import Any, TextIO
+from asset_bundle import AssetBundle
+from config import ASSET_BUNDLE_PATH, ASSET_CACHE_MAX_BYTES
 from response import GlyphMCPResponse
 
 
@@ -7,10 +13,52 @@ def _get_assets_dir() -> str:
     return os.path.join(os.path.dirname(__file__), '..', 'assets')
 
 
-def _get_file_preview(file_path: str, num_lines: int = 5) -> str:
+_bundle: AssetBundle | None = None
+_bundle_checked = False
+
+
+def _get_bundle() -> AssetBundle | None:
+    """
+    Returns the packed asset bundle (see asset_bundle.py), or None to read the loose assets directory.
+    
+    The bundle is opened once, and only if GLYPH_ASSET_BUNDLE names one: a bundle lying next to the
+    assets directory (e.g. a stale one in a development checkout) is never picked up implicitly.
+    Without a (valid) bundle, assets are read from the directory.
+    """
+    global _bundle, _bundle_checked
+    
+    if not _bundle_checked:
+        bundle_path = ASSET_BUNDLE_PATH
+        if bundle_path and os.path.isfile(bundle_path):
+            try:
+                _bundle = AssetBundle(bundle_path)
+            except (OSError, ValueError):
+                _bundle = None
+        _bundle_checked = True
+    
+    return _bundle
+
+
+def _open_asset(rel_path: str, abs_path: str) -> TextIO:
+    """Opens an asset for reading, from the bundle if there is one."""
+    bundle = _get_bundle()
+    if bundle is not None:
+        return io.StringIO(bundle.read(rel_path.replace(os.sep, '/')))
+    return open(abs_path, 'r', encoding='utf-8')
+
+
+def _read_asset_content(rel_path: str, abs_path: str) -> str:
+    """Reads an asset, from the bundle if there is one, else through the content cache."""
+    bundle = _get_bundle()
+    if bundle is not None:
+        return bundle.read(rel_path.replace(os.sep, '/'))
+    return _asset_cache.read(abs_path)
+
+
+def _get_file_preview(rel_path: str, abs_path: str, num_lines: int = 5) -> str:
     """Returns the first few lines of a file for preview."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
+        with _open_asset(rel_path, abs_path) as file:
             lines = []
             for i, line in enumerate(file):
                 if i >= num_lines:
@@ -21,23 +69,164 @@ def _get_file_preview(file_path: str, num_lines: int = 5) -> str:
         return "(Could not read preview)"
 
 
+# Index of the assets tree: filename -> [(relative_path_from_assets, absolute_path)], in walk order
+_asset_index: dict[str, list[tuple[str, str]]] = {}
+# mtime of every directory of the tree when the index was built; adding, removing or renaming
+# a file changes the mtime of its directory, which triggers a rebuild
+_asset_index_dir_mtimes: dict[str, int] = {}
+_asset_index_lock = threading.Lock()
+
+
+def _build_asset_index() -> None:
+    """Walk the assets directory once and index every file by name."""
+    assets_dir = _get_assets_dir()
+    index: dict[str, list[tuple[str, str]]] = {}
+    dir_mtimes: dict[str, int] = {}
+    
+    for root, dirs, files in os.walk(assets_dir):
+        dir_mtimes[root] = os.stat(root).st_mtime_ns
+        for filename in files:
+            abs_path = os.path.join(root, filename)
+            rel_path = os.path.relpath(abs_path, assets_dir)
+            index.setdefault(filename, []).append((rel_path, abs_path))
+    
+    global _asset_index, _asset_index_dir_mtimes
+    _asset_index = index
+    _asset_index_dir_mtimes = dir_mtimes
+
+
+def _is_asset_index_current() -> bool:
+    """Check, with one stat per directory of the assets tree, that no file was added, removed or renamed."""
+    if not _asset_index_dir_mtimes:
+        return False
+    
+    for directory, mtime_ns in _asset_index_dir_mtimes.items():
+        try:
+            if os.stat(directory).st_mtime_ns != mtime_ns:
+                return False
+        except OSError:
+            return False
+    
+    return True
+
+
 def _find_all_matches(filename: str) -> list[tuple[str, str]]:
     """
     Find all files matching the given filename in assets directory.
     
+    Looks the filename up in the asset bundle's index or, without a bundle, in an index of the
+    assets tree, which is built on first use and rebuilt only when a directory of the tree changes.
+    
     Returns:
         List of tuples: (relative_path_from_assets, absolute_path)
     """
-    assets_dir = _get_assets_dir()
-    matches = []
+    bundle = _get_bundle()
+    if bundle is not None:
+        assets_dir = _get_assets_dir()
+        return [
+            (rel_path.replace('/', os.sep), os.path.join(assets_dir, rel_path))
+            for rel_path in bundle.by_filename.get(filename, [])
+        ]
     
-    for root, dirs, files in os.walk(assets_dir):
-        if filename in files:
-            abs_path = os.path.join(root, filename)
-            rel_path = os.path.relpath(abs_path, assets_dir)
-            matches.append((rel_path, abs_path))
+    with _asset_index_lock:
+        if not _is_asset_index_current():
+            _build_asset_index()
+        
+        return list(_asset_index.get(filename, []))
+
+
+class AssetContentCache:
+    """
+    Bounded LRU cache of decoded asset contents.
+    
+    Entries are keyed by normalized absolute path (callers may reach the same file through
+    different spellings, e.g. with or without "src/..") and revalidated on every lookup with a
+    stat of the file (size and mtime), so edited assets are re-read without restarting the server.
+    """
+    
+    def __init__(self, max_bytes: int):
+        """
+        Args:
+            max_bytes: Maximum total size of the cached files; files larger than this are never cached.
+        """
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # abs_path -> (size, mtime_ns, content), least recently used first
+        self._entries: OrderedDict[str, tuple[int, int, str]] = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def read(self, file_path: str) -> str:
+        """
+        Read a text file, from the cache if it has not changed since it was cached.
+        
+        Args:
+            file_path: Absolute path of the file.
+        
+        Returns:
+            The file content.
+        """
+        file_path = os.path.normpath(file_path)
+        stat_result = os.stat(file_path)
+        signature = (stat_result.st_size, stat_result.st_mtime_ns)
+        
+        with self._lock:
+            entry = self._entries.get(file_path)
+            if entry is not None and entry[:2] == signature:
+                self._entries.move_to_end(file_path)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+        
+        with open(file_path, 'r', encoding='utf-8') as file:
+            content = file.read()
+        
+        with self._lock:
+            self._store(file_path, signature, content)
+        
+        return content
     
-    return matches
+    def _store(self, file_path: str, signature: tuple[int, int], content: str) -> None:
+        """Insert or replace an entry, evicting the least recently used ones beyond max_bytes."""
+        previous = self._entries.pop(file_path, None)
+        if previous is not None:
+            self.current_bytes -= previous[0]
+        
+        size = signature[0]
+        if size > self.max_bytes:
+            return
+        
+        self._entries[file_path] = (*signature, content)
+        self.current_bytes += size
+        
+        while self.current_bytes > self.max_bytes:
+            _, (evicted_size, _, _) = self._entries.popitem(last=False)
+            self.current_bytes -= evicted_size
+            self.evictions += 1
+    
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters and current occupancy, for monitoring."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes
+            }
+
+
+_asset_cache = AssetContentCache(ASSET_CACHE_MAX_BYTES)
+
+
+def get_asset_cache_stats() -> dict[str, Any]:
+    """Returns the hit/miss counters and occupancy of the asset content cache."""
+    return _asset_cache.stats()
 
 
 def read_asset(filename: str) -> str:
@@ -62,8 +251,7 @@ def read_asset(filename: str) -> str:
         
         if len(matches) == 1:
             rel_path, abs_path = matches[0]
-            with open(abs_path, 'r', encoding='utf-8') as file:
-                return file.read()
+            return _read_asset_content(rel_path, abs_path)
         
         # Multiple matches found - provide helpful error
         error_lines = [
@@ -74,7 +262,7 @@ def read_asset(filename: str) -> str:
         ]
         
         for rel_path, abs_path in matches:
-            preview = _get_file_preview(abs_path)
+            preview = _get_file_preview(rel_path, abs_path)
             error_lines.append(f"  Path: {rel_path}")
             error_lines.append(f"  Preview:")
             for line in preview.split('\n'):
@@ -110,11 +298,17 @@ def read_asset_exact(relative_path: str) -> str:
         # Normalize path separators for cross-platform compatibility
         file_path = os.path.normpath(file_path)
         
+        bundle = _get_bundle()
+        if bundle is not None:
+            bundle_path = os.path.relpath(file_path, os.path.normpath(assets_dir)).replace(os.sep, '/')
+            if bundle_path not in bundle:
+                return f"Asset file '{relative_path}' not found. Ensure the path is relative to the assets directory."
+            return bundle.read(bundle_path)
+        
         if not os.path.isfile(file_path):
             return f"Asset file '{relative_path}' not found. Ensure the path is relative to the assets directory."
         
-        with open(file_path, 'r', encoding='utf-8') as file:
-            return file.read()
+        return _asset_cache.read(file_path)
         
     except Exception as e:
         return f"Error reading asset file '{relative_path}': {str(e)}"
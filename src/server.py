@@ -19,7 +19,7 @@ if __name__ == "__main__":
             get_principles,
             get_example,
             read_asset_exact,
-            
+            get_asset_cache_stats
         )
 
         # Tools (action tools)
@@ -27,9 +27,31 @@ if __name__ == "__main__":
         from tools.add_design_log import add_design_log
         from tools.add_operation import add_operation
         from tools.persist_artifact import persist_artifacts
-        from tools.reference_graph import update_reference_graph, get_references_from, find_references_to
+        from tools.artifact_store import gc_artifact_blobs
+        from tools.reference_graph import (
+            update_reference_graph,
+            export_reference_graph,
+            get_references_from,
+            find_references_to,
+            get_transitive_references,
+            traverse_references,
+            find_reference_path
+        )
+        from tools.reference_refresh import get_reference_graph_status
+        from tools.reference_watcher import (
+            watch_reference_graph,
+            unwatch_reference_graph,
+            start_reference_watcher
+        )
         from tools.static_code_analysis import static_code_analysis
 
+        # Optional background watchers keeping reference graphs live
+        import os
+        from config import BASE_NAME, REFERENCE_WATCH_PATHS
+        for watch_path in REFERENCE_WATCH_PATHS:
+            start_reference_watcher(os.path.join(watch_path, BASE_NAME))
+            print(f"Watching {watch_path} for reference changes")
+
         print("Starting MCP server...")
 
         mcp.run()
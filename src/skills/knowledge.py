@@ -3,10 +3,10 @@ Consolidated knowledge/skills module.
 
 Provides access to all Glyph knowledge assets: principles, examples, and guidelines.
 """
-from typing import Literal
+from typing import Any, Literal
 from mcp_object import mcp
 from response import GlyphMCPResponse
-from read_an_asset import read_asset, read_asset_exact as _read_asset_exact
+from read_an_asset import get_asset_cache_stats as _get_asset_cache_stats, read_asset, read_asset_exact as _read_asset_exact
 
 
 def _read_asset_with_response(filename: str) -> GlyphMCPResponse[str]:
@@ -159,3 +159,16 @@ def mermaid_whisperer() -> GlyphMCPResponse[str]:
     """
     return _read_asset_with_response("examples/mermaid_chart_types.md")
 
+
+@mcp.tool()
+def get_asset_cache_stats() -> GlyphMCPResponse[dict[str, Any]]:
+    """
+    Returns statistics of the in-memory cache of asset files (prompts, rules, templates, examples).
+
+    Returns:
+        GlyphMCPResponse containing hits, misses, hit_rate, evictions, entries, bytes and max_bytes.
+    """
+    response = GlyphMCPResponse[dict[str, Any]]()
+    response.result = _get_asset_cache_stats()
+    response.success = True
+    return response
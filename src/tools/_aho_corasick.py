@@ -0,0 +1,163 @@
+"""
+Aho-Corasick multi-pattern string matcher.
+
+Builds a single automaton from a set of literal patterns so that a text can be
+scanned once, regardless of how many patterns are searched for.
+"""
+from collections import deque
+from typing import Iterable, Iterator
+
+
+class AhoCorasickMatcher:
+    """Literal multi-pattern matcher with plain substring semantics."""
+
+    def __init__(self, patterns: Iterable[str]):
+        """
+        Build the automaton for the given patterns.
+
+        Empty and duplicate patterns are ignored.
+
+        Args:
+            patterns: The literal strings to search for.
+        """
+        self.patterns: list[str] = []
+        # Per-state transitions, failure links, the pattern ending at the state (-1 if none)
+        # and the nearest state on the failure chain that ends a pattern (0 if none)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[int] = [-1]
+        self._dict_link: list[int] = [0]
+
+        seen = set()
+        for pattern in patterns:
+            if not pattern or pattern in seen:
+                continue
+            seen.add(pattern)
+            self._add_pattern(pattern)
+
+        self._build_links()
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def _add_pattern(self, pattern: str) -> None:
+        """Insert a pattern into the trie."""
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(-1)
+                self._dict_link.append(0)
+                self._goto[state][char] = next_state
+            state = next_state
+        self._output[state] = len(self.patterns)
+        self.patterns.append(pattern)
+
+    def _build_links(self) -> None:
+        """Compute failure and dictionary-suffix links breadth first."""
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                fail = self._goto[fallback].get(char, 0)
+                if fail == child:
+                    fail = 0
+
+                self._fail[child] = fail
+                self._dict_link[child] = fail if self._output[fail] != -1 else self._dict_link[fail]
+
+    def find_all(self, text: str) -> set[str]:
+        """
+        Find which patterns occur anywhere in the text.
+
+        Equivalent to ``{p for p in patterns if p in text}`` but scans the text once.
+
+        Args:
+            text: The text to scan.
+
+        Returns:
+            Set of patterns that occur in the text.
+        """
+        if not self.patterns:
+            return set()
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        dict_link = self._dict_link
+
+        found_ids: set[int] = set()
+        state = 0
+
+        for char in text:
+            next_state = goto[state].get(char)
+            while next_state is None and state:
+                state = fail[state]
+                next_state = goto[state].get(char)
+            state = next_state or 0
+
+            # Walk the matches ending here; once a known pattern is reached, all of its
+            # suffix patterns were already reported when it was first found
+            match = state if output[state] != -1 else dict_link[state]
+            while match and output[match] not in found_ids:
+                found_ids.add(output[match])
+                match = dict_link[match]
+
+        return {self.patterns[pattern_id] for pattern_id in found_ids}
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, str]]:
+        """
+        Find non-overlapping pattern occurrences, leftmost first and longest at each position.
+
+        For a single pattern this yields the same occurrences ``str.replace`` would replace.
+
+        Args:
+            text: The text to scan.
+
+        Yields:
+            Tuples of (start_index, pattern), in text order.
+        """
+        if not self.patterns:
+            return
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        dict_link = self._dict_link
+        patterns = self.patterns
+
+        # Longest pattern starting at each position where any pattern occurs
+        longest: dict[int, int] = {}
+        state = 0
+
+        for index, char in enumerate(text):
+            next_state = goto[state].get(char)
+            while next_state is None and state:
+                state = fail[state]
+                next_state = goto[state].get(char)
+            state = next_state or 0
+
+            match = state if output[state] != -1 else dict_link[state]
+            while match:
+                pattern_id = output[match]
+                start = index - len(patterns[pattern_id]) + 1
+                best = longest.get(start)
+                if best is None or len(patterns[pattern_id]) > len(patterns[best]):
+                    longest[start] = pattern_id
+                match = dict_link[match]
+
+        position = 0
+        for start in sorted(longest):
+            if start >= position:
+                pattern = patterns[longest[start]]
+                yield start, pattern
+                position = start + len(pattern)
@@ -0,0 +1,248 @@
+"""
+SQLite storage for the reference graph.
+
+An alternative to reference_graph.csv + reference_graph_manifest.json that can be updated
+incrementally (transactional upserts) and queried with indexed point lookups.
+"""
+import json
+import sqlite3
+from typing import Any
+
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS files (
+    rel_path TEXT PRIMARY KEY,
+    filename TEXT NOT NULL,
+    dir_type TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT,
+    found_references TEXT NOT NULL,
+    position INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS edges (
+    source_path TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    start_point TEXT NOT NULL,
+    end_point TEXT NOT NULL,
+    PRIMARY KEY (source_path, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_files_filename ON files(filename);
+CREATE INDEX IF NOT EXISTS idx_edges_start_point ON edges(start_point);
+CREATE INDEX IF NOT EXISTS idx_edges_end_point ON edges(end_point);
+"""
+
+
+def connect(db_path: str) -> sqlite3.Connection:
+    """
+    Open the reference database, creating the schema if needed.
+
+    A database from another schema version is reset, which forces a full rebuild.
+
+    Args:
+        db_path: Path to the SQLite database file.
+
+    Returns:
+        An open connection.
+    """
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA)
+
+    row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+    if row is None or row[0] != str(SCHEMA_VERSION):
+        with conn:
+            conn.execute("DELETE FROM edges")
+            conn.execute("DELETE FROM files")
+            conn.execute("DELETE FROM meta")
+            conn.execute("INSERT INTO meta (key, value) VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+
+    return conn
+
+
+def load_manifest(conn: sqlite3.Connection, manifest_version: int) -> dict[str, Any]:
+    """
+    Load the stored files as a manifest, in the same format as reference_graph_manifest.json.
+
+    Args:
+        conn: Open database connection.
+        manifest_version: The manifest version to stamp on the result.
+
+    Returns:
+        The manifest.
+    """
+    row = conn.execute("SELECT value FROM meta WHERE key = 'targets'").fetchone()
+    targets = json.loads(row[0]) if row else []
+
+    files = {}
+    for rel_path, filename, dir_type, size, mtime_ns, sha256, found_references in conn.execute(
+        "SELECT rel_path, filename, dir_type, size, mtime_ns, sha256, found_references FROM files ORDER BY position"
+    ):
+        files[rel_path] = {
+            "filename": filename,
+            "dir": dir_type,
+            "size": size,
+            "mtime_ns": mtime_ns,
+            "sha256": sha256,
+            "references": json.loads(found_references)
+        }
+
+    return {"version": manifest_version, "targets": targets, "files": files}
+
+
+def load_signature(conn: sqlite3.Connection) -> dict[str, tuple[int, int]]:
+    """
+    Load the (size, mtime_ns) signature of every stored file.
+
+    Args:
+        conn: Open database connection.
+
+    Returns:
+        Dict mapping relative paths to their recorded signature.
+    """
+    return {
+        rel_path: (size, mtime_ns)
+        for rel_path, size, mtime_ns in conn.execute("SELECT rel_path, size, mtime_ns FROM files")
+    }
+
+
+def save_scan(
+    conn: sqlite3.Connection,
+    manifest: dict[str, Any],
+    edges: list[tuple[str, str]],
+    edge_ranges: dict[str, tuple[int, int]]
+) -> int:
+    """
+    Store the result of a scan, writing only the rows that changed, in a single transaction.
+
+    Args:
+        conn: Open database connection.
+        manifest: The manifest produced by the scan.
+        edges: The edges produced by the scan, in walk order.
+        edge_ranges: Dict mapping each file's relative path to its (start, end) slice of edges.
+
+    Returns:
+        Number of files whose rows were inserted or updated.
+    """
+    stored_files = {
+        rel_path: (position, size, mtime_ns, sha256, found_references)
+        for rel_path, position, size, mtime_ns, sha256, found_references in conn.execute(
+            "SELECT rel_path, position, size, mtime_ns, sha256, found_references FROM files"
+        )
+    }
+    stored_edges: dict[str, list[tuple[str, str]]] = {}
+    for source_path, start_point, end_point in conn.execute(
+        "SELECT source_path, start_point, end_point FROM edges ORDER BY source_path, seq"
+    ):
+        stored_edges.setdefault(source_path, []).append((start_point, end_point))
+
+    upserted = 0
+
+    with conn:
+        for position, (rel_path, entry) in enumerate(manifest["files"].items()):
+            found_references = json.dumps(entry["references"])
+            stored = stored_files.get(rel_path)
+
+            if stored != (position, entry["size"], entry["mtime_ns"], entry["sha256"], found_references):
+                conn.execute(
+                    "INSERT INTO files (rel_path, filename, dir_type, size, mtime_ns, sha256, found_references, position) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(rel_path) DO UPDATE SET "
+                    "filename = excluded.filename, dir_type = excluded.dir_type, size = excluded.size, "
+                    "mtime_ns = excluded.mtime_ns, sha256 = excluded.sha256, "
+                    "found_references = excluded.found_references, position = excluded.position",
+                    (rel_path, entry["filename"], entry["dir"], entry["size"], entry["mtime_ns"],
+                     entry["sha256"], found_references, position)
+                )
+                upserted += 1
+
+            start, end = edge_ranges.get(rel_path, (0, 0))
+            file_edges = edges[start:end]
+            if stored_edges.get(rel_path, []) != file_edges:
+                conn.execute("DELETE FROM edges WHERE source_path = ?", (rel_path,))
+                conn.executemany(
+                    "INSERT INTO edges (source_path, seq, start_point, end_point) VALUES (?, ?, ?, ?)",
+                    [(rel_path, seq, source, target) for seq, (source, target) in enumerate(file_edges)]
+                )
+
+        deleted = [(rel_path,) for rel_path in stored_files if rel_path not in manifest["files"]]
+        conn.executemany("DELETE FROM files WHERE rel_path = ?", deleted)
+        conn.executemany("DELETE FROM edges WHERE source_path = ?", deleted)
+
+        conn.execute(
+            "INSERT INTO meta (key, value) VALUES ('targets', ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (json.dumps(manifest["targets"]),)
+        )
+
+    return upserted
+
+
+def load_edges(conn: sqlite3.Connection) -> tuple[list[tuple[str, str]], dict[str, str]]:
+    """
+    Load all edges in walk order, together with each file's directory type.
+
+    Args:
+        conn: Open database connection.
+
+    Returns:
+        Tuple of (edges, file_to_dir) as produced by a scan.
+    """
+    edges = [
+        (start_point, end_point)
+        for start_point, end_point in conn.execute(
+            "SELECT e.start_point, e.end_point FROM edges e JOIN files f ON f.rel_path = e.source_path "
+            "ORDER BY f.position, e.seq"
+        )
+    ]
+    file_to_dir = {
+        filename: dir_type
+        for filename, dir_type in conn.execute("SELECT filename, dir_type FROM files ORDER BY position")
+    }
+    return edges, file_to_dir
+
+
+def contains(conn: sqlite3.Connection, file_name: str) -> bool:
+    """
+    Check whether a file is in the graph, either as a scanned file or as a referenced one.
+
+    Args:
+        conn: Open database connection.
+        file_name: The file name to look up.
+
+    Returns:
+        True if the file is in the graph.
+    """
+    row = conn.execute(
+        "SELECT EXISTS (SELECT 1 FROM files WHERE filename = ?) OR EXISTS (SELECT 1 FROM edges WHERE end_point = ?)",
+        (file_name, file_name)
+    ).fetchone()
+    return bool(row[0])
+
+
+def query_references(conn: sqlite3.Connection, file_name: str, reverse: bool) -> list[str]:
+    """
+    Get the files a file references (or, if reverse, the files referencing it) with an indexed lookup.
+
+    Args:
+        conn: Open database connection.
+        file_name: The file name to look up.
+        reverse: If False, match start_point and return end_point; if True, the other way around.
+
+    Returns:
+        Distinct matching file names, in walk order.
+    """
+    match_column, return_column = ("end_point", "start_point") if reverse else ("start_point", "end_point")
+    return [
+        row[0]
+        for row in conn.execute(
+            f"SELECT e.{return_column} FROM edges e JOIN files f ON f.rel_path = e.source_path "
+            f"WHERE e.{match_column} = ? GROUP BY e.{return_column} ORDER BY MIN(f.position), MIN(e.seq)",
+            (file_name,)
+        )
+    ]
@@ -3,10 +3,34 @@ Utility functions for tool operations.
 """
 import os
 import re
+import shutil
+import sys
+import tempfile
+from contextlib import contextmanager
+from typing import Iterator
 from config import BASE_NAME
 from response import GlyphMCPResponse
 from read_an_asset import read_asset
 
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:  # Only available on Windows
+    msvcrt = None
+
+# ioctl request cloning a whole file on Linux (btrfs, XFS, bcachefs, ...): _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+
+# Bytes moved per copy_file_range/sendfile call
+COPY_CHUNK_SIZE = 64 * 1024 * 1024
+
+# Directory (inside .assistant) holding the document number counters
+COUNTERS_DIR_NAME = ".counters"
+
 
 def validate_absolute_path(abs_path: str, response: GlyphMCPResponse) -> bool:
     """
@@ -36,6 +60,139 @@ def validate_absolute_path(abs_path: str, response: GlyphMCPResponse) -> bool:
     return True
 
 
+def atomic_write_text(file_path: str, content: str) -> None:
+    """
+    Write a text file atomically: readers see either the old or the new content, never a partial write.
+    
+    The content is written to a temporary file in the same directory, flushed to disk and then
+    renamed over the target. The permissions of an existing target are kept.
+    
+    Args:
+        file_path: Path of the file to write.
+        content: The text to write (UTF-8).
+    """
+    directory = os.path.dirname(file_path) or "."
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(file_path)}.", suffix=".tmp")
+    
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        
+        if os.path.exists(file_path):
+            os.chmod(temp_path, os.stat(file_path).st_mode & 0o7777)
+        
+        os.replace(temp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _reflink(source_file_path: str, destination_path: str) -> bool:
+    """Clone the file's extents copy-on-write (FICLONE), if the platform and filesystem support it."""
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+    
+    with open(source_file_path, 'rb') as src, open(destination_path, 'wb') as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except OSError:
+            return False
+    return True
+
+
+def _kernel_copy(source_file_path: str, destination_path: str) -> str | None:
+    """
+    Copy a file inside the kernel, without moving the data through user space.
+    
+    Args:
+        source_file_path: Path to the file to copy.
+        destination_path: Path of the new file.
+    
+    Returns:
+        'copy_file_range' or 'sendfile' depending on what worked, or None if neither is available.
+    """
+    with open(source_file_path, 'rb') as src, open(destination_path, 'wb') as dst:
+        src_fd, dst_fd = src.fileno(), dst.fileno()
+        size = os.fstat(src_fd).st_size
+        
+        for strategy in ("copy_file_range", "sendfile"):
+            if not hasattr(os, strategy):
+                continue
+            
+            offset = 0
+            try:
+                while offset < size:
+                    if strategy == "copy_file_range":
+                        sent = os.copy_file_range(src_fd, dst_fd, COPY_CHUNK_SIZE, offset, offset)
+                    else:
+                        sent = os.sendfile(dst_fd, src_fd, offset, COPY_CHUNK_SIZE)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except OSError:
+                # Unsupported for these files (e.g. across filesystems on older kernels): try the next one
+                offset = -1
+            
+            if offset == size:
+                return strategy
+            dst.seek(0)
+            dst.truncate()
+    
+    return None
+
+
+def copy_file_fast(source_file_path: str, destination_path: str, allow_move: bool = False) -> str:
+    """
+    Copy a file using the cheapest strategy the platform and filesystem support.
+    
+    Strategies are tried in order:
+    1. reflink: a copy-on-write clone sharing the data blocks (instant, no extra space).
+    2. hardlink: only if allow_move and both paths are on the same filesystem; meant for files
+       deleted from their source right after, which makes it a rename.
+    3. copy_file_range / sendfile: an in-kernel copy.
+    4. copy: shutil.copy2.
+    Except for the hardlink, metadata (timestamps, permissions) is copied like shutil.copy2 does.
+    
+    Args:
+        source_file_path: Path to the file to copy.
+        destination_path: Path of the new file.
+        allow_move: True if the source file will be deleted after the copy.
+    
+    Returns:
+        The strategy used: 'reflink', 'hardlink', 'copy_file_range', 'sendfile' or 'copy'.
+    """
+    if _reflink(source_file_path, destination_path):
+        shutil.copystat(source_file_path, destination_path)
+        return "reflink"
+    
+    if allow_move:
+        destination_dir = os.path.dirname(destination_path)
+        if os.stat(source_file_path).st_dev == os.stat(destination_dir).st_dev:
+            if os.path.exists(destination_path):
+                os.remove(destination_path)
+            try:
+                os.link(source_file_path, destination_path)
+                return "hardlink"
+            except OSError:
+                pass
+    
+    try:
+        strategy = _kernel_copy(source_file_path, destination_path)
+    except OSError:
+        strategy = None
+    if strategy is not None:
+        shutil.copystat(source_file_path, destination_path)
+        return strategy
+    
+    shutil.copy2(source_file_path, destination_path)
+    return "copy"
+
+
 def get_next_number(directory: str, prefix: str, extension: str = ".md") -> int:
     """
     Get the next document number by scanning existing files in a directory.
@@ -67,6 +224,90 @@ def get_next_number(directory: str, prefix: str, extension: str = ".md") -> int:
     return max_number + 1
 
 
+@contextmanager
+def locked_file(file_path: str) -> Iterator[int]:
+    """
+    Open (creating if needed) a file and hold an exclusive lock on it, across processes.
+    
+    Args:
+        file_path: Path to the file to lock.
+    
+    Yields:
+        The file descriptor, opened for reading and writing.
+    """
+    fd = os.open(file_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        elif msvcrt is not None:
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        
+        yield fd
+    finally:
+        if fcntl is None and msvcrt is not None:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        # Closing the descriptor releases the flock
+        os.close(fd)
+
+
+def _directory_mtime(directory: str) -> int | None:
+    """Modification time of a directory in nanoseconds, or None if it does not exist."""
+    try:
+        return os.stat(directory).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+@contextmanager
+def reserve_numbers(directory: str, prefix: str, extension: str = ".md", count: int = 1) -> Iterator[int]:
+    """
+    Reserve the next document number(s) in a directory, in constant time, while the documents are created.
+    
+    The next free number is kept in a counter file under .assistant/.counters, one per directory
+    and prefix, read and advanced under an exclusive file lock so concurrent MCP clients never get
+    the same number. Create the documents inside the with block: the lock is held until it exits,
+    and the counter then records the directory's modification time. If the directory changed since
+    (documents pulled with git, created by hand or restored), or the counter is missing or corrupt,
+    the directory is scanned and the numbers found there are skipped.
+    
+    Args:
+        directory: Path to the directory the documents are created in.
+        prefix: The file prefix (e.g., 'dl', 'op' or 'art').
+        extension: The file extension used by the rebuild scan (see get_next_number).
+        count: How many consecutive numbers to reserve.
+    
+    Yields:
+        The first reserved number; the reserved numbers are [first, first + count).
+    """
+    counters_dir = os.path.join(os.path.dirname(directory), COUNTERS_DIR_NAME)
+    os.makedirs(counters_dir, exist_ok=True)
+    counter_path = os.path.join(counters_dir, f"{os.path.basename(directory)}_{prefix}")
+    
+    with locked_file(counter_path) as fd:
+        fields = os.read(fd, 64).decode('ascii', errors='replace').split()
+        try:
+            next_number = int(fields[0])
+        except (IndexError, ValueError):
+            next_number = 0
+        try:
+            recorded_mtime = int(fields[1])
+        except (IndexError, ValueError):
+            recorded_mtime = None
+        
+        # Missing or corrupt counter, or documents added behind our back: rescan the directory
+        if next_number < 1 or recorded_mtime is None or recorded_mtime != _directory_mtime(directory):
+            next_number = max(next_number, get_next_number(directory, prefix, extension))
+        
+        try:
+            yield next_number
+        finally:
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.ftruncate(fd, 0)
+            os.write(fd, f"{next_number + count} {_directory_mtime(directory)}\n".encode('ascii'))
+            os.fsync(fd)
+
+
 def sanitize_title(title: str) -> str:
     """
     Sanitize a title for use in a filename.
@@ -117,22 +358,19 @@ def add_document(
             )
             return response
         
-        # Get the next document number
-        next_number = get_next_number(doc_dir, prefix)
+        # Read the template
+        template_content = read_asset(template_asset)
         
         # Sanitize the title for use in filename
         sanitized_title = sanitize_title(title)
         
-        # Create the new filename
-        new_filename = f"{prefix}_{next_number}_{sanitized_title}.md"
-        new_filepath = os.path.join(doc_dir, new_filename)
-        
-        # Read the template
-        template_content = read_asset(template_asset)
-        
-        # Write the new document file
-        with open(new_filepath, 'w', encoding='utf-8') as f:
-            f.write(template_content)
+        # Reserve the next document number and create the document under it
+        with reserve_numbers(doc_dir, prefix) as next_number:
+            new_filename = f"{prefix}_{next_number}_{sanitized_title}.md"
+            new_filepath = os.path.join(doc_dir, new_filename)
+            
+            with open(new_filepath, 'w', encoding='utf-8') as f:
+                f.write(template_content)
         
         response.add_context(f"Created new {doc_type}: {new_filename}")
         response.add_context(f"It's advised to edit other documents you might want to reference this new doc, and vice versa, to ensure proper linking and context.")
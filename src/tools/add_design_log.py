@@ -3,6 +3,7 @@ from mcp_object import mcp
 from config import BASE_NAME
 from response import GlyphMCPResponse
 from ._utils import add_document, validate_absolute_path
+from .reference_graph import invalidate_reference_graph
 
 
 def append_to_summary(summary_path: str, filename: str, short_desc: str) -> tuple[bool, str]:
@@ -80,5 +81,6 @@ def add_design_log(abs_path: str, title: str, short_desc: str) -> GlyphMCPRespon
     )
     
     update_design_log_summary(response, abs_path, title, short_desc)
+    invalidate_reference_graph(abs_path)
     
     return response
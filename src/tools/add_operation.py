@@ -1,6 +1,7 @@
 from mcp_object import mcp
 from response import GlyphMCPResponse
 from ._utils import add_document, validate_absolute_path
+from .reference_graph import invalidate_reference_graph
 
 
 @mcp.tool()
@@ -21,7 +22,7 @@ def add_operation(abs_path: str, title: str) -> GlyphMCPResponse[None]:
     if not validate_absolute_path(abs_path, response):
         return response
     
-    return add_document(
+    response = add_document(
         abs_path=abs_path,
         title=title,
         subdirectory="operations",
@@ -29,3 +30,6 @@ def add_operation(abs_path: str, title: str) -> GlyphMCPResponse[None]:
         template_asset="operation_doc_template.md",
         doc_type="operation document"
     )
+    invalidate_reference_graph(abs_path)
+    
+    return response
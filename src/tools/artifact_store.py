@@ -0,0 +1,264 @@
+"""
+Content-addressed blob store for persisted artifacts.
+
+Blobs live in .assistant/blobs/<first two hex digits>/<sha256> and artifacts in
+.assistant/artifacts are hard links to them, so identical content persisted several
+times is stored once. A blob whose only remaining link is the store's own entry is
+unreferenced and can be removed with gc_artifact_blobs.
+
+Note that a hard-linked artifact shares its data with every other artifact of the same
+content: editors that rewrite files in place change them all, while tools that replace
+the file (like the reference fixing of persist_artifacts) break the link instead. Such an
+edit also changes the blob itself, so a blob is re-hashed before being reused and replaced
+by a fresh one if it no longer holds the content its name promises.
+"""
+import hashlib
+import os
+import tempfile
+import time
+from typing import Any
+from mcp_object import mcp
+from config import BASE_NAME
+from response import GlyphMCPResponse
+from ._utils import copy_file_fast, validate_absolute_path
+
+
+BLOBS_DIR_NAME = "blobs"
+
+# Seconds a blob or temporary file is left alone by gc after it was last written or linked,
+# so a persist in progress never loses the blob it is about to link
+BLOB_GC_GRACE_PERIOD = 5 * 60
+
+
+def hash_file(file_path: str) -> str:
+    """
+    Compute the SHA-256 of a file, streaming it in chunks.
+    
+    Args:
+        file_path: Path to the file to hash.
+    
+    Returns:
+        Hex digest of the file's content.
+    """
+    with open(file_path, 'rb') as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def get_blob_path(blobs_dir: str, digest: str) -> str:
+    """Path of the blob with the given digest."""
+    return os.path.join(blobs_dir, digest[:2], digest)
+
+
+def blob_matches(blob_path: str, digest: str, size: int) -> bool:
+    """
+    Check that a blob still holds the content its digest names.
+    
+    Args:
+        blob_path: Path to the blob.
+        digest: The digest the blob is named after.
+        size: Size of the content with that digest.
+    
+    Returns:
+        True if the blob exists and its content hashes to the digest.
+    """
+    try:
+        if os.stat(blob_path).st_size != size:
+            return False
+        return hash_file(blob_path) == digest
+    except FileNotFoundError:
+        return False
+
+
+def store_blob(blobs_dir: str, source_file_path: str, allow_move: bool = False) -> tuple[str, str | None]:
+    """
+    Add a file's content to the blob store, unless it is already there.
+    
+    Args:
+        blobs_dir: Path to the blob store directory.
+        source_file_path: Path to the file to store.
+        allow_move: True if the source file will be deleted afterwards (lets the copy hardlink it).
+    
+    Returns:
+        A tuple of (blob_path, copy_strategy), where copy_strategy is None if the blob already existed.
+    """
+    digest = hash_file(source_file_path)
+    blob_path = get_blob_path(blobs_dir, digest)
+    if os.path.exists(blob_path):
+        if blob_matches(blob_path, digest, os.path.getsize(source_file_path)):
+            return blob_path, None
+        
+        # An artifact linked to the blob was edited in place: unlink the stale blob (the edited
+        # artifacts keep their data) and store the content again
+        try:
+            os.remove(blob_path)
+        except FileNotFoundError:
+            pass
+    
+    # Copy next to the blob first so a partially written blob is never visible under its digest.
+    # The temporary name is unique, as threads of one persist may store the same content at once.
+    while True:
+        os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(blob_path), prefix=f"{digest}.", suffix=".tmp")
+            break
+        except FileNotFoundError:
+            # gc removed the fan-out directory while it was empty: create it again
+            continue
+    os.close(fd)
+    try:
+        copy_strategy = copy_file_fast(source_file_path, temp_path, allow_move)
+        os.replace(temp_path, blob_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    
+    return blob_path, copy_strategy
+
+
+def link_blob(blob_path: str, destination_path: str) -> str:
+    """
+    Create a file pointing at a blob: a hard link, or a copy where hard links are not supported.
+    
+    Args:
+        blob_path: Path to the blob.
+        destination_path: Path of the file to create.
+    
+    Returns:
+        'hardlink', or the copy strategy used as a fallback.
+    """
+    try:
+        os.link(blob_path, destination_path)
+        return "hardlink"
+    except OSError:
+        return copy_file_fast(blob_path, destination_path)
+
+
+def persist_to_blob_store(assistant_dir: str, source_file_path: str, destination_path: str, allow_move: bool = False) -> str:
+    """
+    Persist a file as a link into the blob store.
+    
+    Args:
+        assistant_dir: Path to the .assistant directory.
+        source_file_path: Path to the file to persist.
+        destination_path: Path of the artifact to create.
+        allow_move: True if the source file will be deleted afterwards.
+    
+    Returns:
+        A description of how the file was stored, for the response context.
+    """
+    blobs_dir = os.path.join(assistant_dir, BLOBS_DIR_NAME)
+    blob_path, copy_strategy = store_blob(blobs_dir, source_file_path, allow_move)
+    try:
+        link_strategy = link_blob(blob_path, destination_path)
+    except FileNotFoundError:
+        # An existing unreferenced blob was collected by gc before we linked it: store it again
+        blob_path, copy_strategy = store_blob(blobs_dir, source_file_path, allow_move)
+        link_strategy = link_blob(blob_path, destination_path)
+    
+    digest = os.path.basename(blob_path)
+    if copy_strategy is None:
+        return f"deduplicated ({link_strategy} to existing blob {digest})"
+    return f"blob ({link_strategy} to new blob {digest}, stored via {copy_strategy})"
+
+
+def find_unreferenced_blobs(blobs_dir: str, grace_period: float = BLOB_GC_GRACE_PERIOD) -> list[str]:
+    """
+    Find blobs no artifact links to anymore, and leftover temporary files of interrupted copies.
+    
+    Files written or linked within the grace period are skipped: they may belong to a persist in
+    progress (a temporary file being copied, or a new blob not linked to its artifact yet).
+    
+    Args:
+        blobs_dir: Path to the blob store directory.
+        grace_period: Seconds since their last change (mtime or ctime) before files can be collected.
+    
+    Returns:
+        List of paths that can be deleted.
+    """
+    unreferenced = []
+    
+    if not os.path.exists(blobs_dir):
+        return unreferenced
+    
+    cutoff = time.time() - grace_period
+    for root, dirs, files in os.walk(blobs_dir):
+        for filename in files:
+            file_path = os.path.join(root, filename)
+            try:
+                stat = os.stat(file_path)
+            except FileNotFoundError:
+                continue
+            if max(stat.st_mtime, stat.st_ctime) > cutoff:
+                continue
+            if filename.endswith(".tmp") or stat.st_nlink <= 1:
+                unreferenced.append(file_path)
+    
+    return unreferenced
+
+
+@mcp.tool()
+def gc_artifact_blobs(abs_path: str, dry_run: bool = False) -> GlyphMCPResponse[dict[str, Any]]:
+    """
+    Delete blobs of the artifact store that no artifact links to anymore.
+    
+    Blobs are created by persist_artifacts when the server runs with GLYPH_ARTIFACT_DEDUP enabled.
+    A blob becomes unreferenced when every artifact with its content has been deleted. Blobs and
+    temporary files changed in the last few minutes are kept, as a persist may still be using them.
+    
+    Args:
+        abs_path: The absolute path of the project's root where the .assistant folder is located. Absolute path is required.
+        dry_run: If True, only report what would be deleted.
+    
+    Returns:
+        GlyphMCPResponse containing the number of blobs removed (or removable) and the bytes freed.
+    """
+    response = GlyphMCPResponse[dict[str, Any]]()
+    
+    if not validate_absolute_path(abs_path, response):
+        return response
+    
+    try:
+        blobs_dir = os.path.join(abs_path, BASE_NAME, BLOBS_DIR_NAME)
+        
+        if not os.path.exists(blobs_dir):
+            response.add_context(f"No blob store found at {blobs_dir}; nothing to collect")
+            response.result = {"removed": 0, "bytes_freed": 0}
+            response.success = True
+            return response
+        
+        removed = 0
+        bytes_freed = 0
+        for blob_path in find_unreferenced_blobs(blobs_dir):
+            try:
+                size = os.path.getsize(blob_path)
+            except FileNotFoundError:
+                continue
+            if not dry_run:
+                try:
+                    os.remove(blob_path)
+                except OSError as e:
+                    response.add_context(f"Warning: Failed to delete {blob_path}: {str(e)}")
+                    continue
+            removed += 1
+            bytes_freed += size
+        
+        if not dry_run:
+            # Drop fan-out directories left empty
+            for entry in os.scandir(blobs_dir):
+                if entry.is_dir() and not os.listdir(entry.path):
+                    try:
+                        os.rmdir(entry.path)
+                    except OSError:
+                        # A persist stored a blob in it meanwhile
+                        pass
+        
+        verb = "Would remove" if dry_run else "Removed"
+        response.add_context(f"{verb} {removed} unreferenced blob(s), {bytes_freed} bytes")
+        response.result = {"removed": removed, "bytes_freed": bytes_freed}
+        response.success = True
+        
+    except Exception as e:
+        response.add_context(f"Failed to collect artifact blobs: {str(e)}")
+    
+    return response
@@ -0,0 +1,90 @@
+"""
+Persistent cache of per-file code metrics for static_code_analysis.
+
+Entries live in .assistant/cache/code_metrics/<language>-v<parser version>/<first two hex
+digits>/<sha256 of the file>.json and hold the serialized FileMetrics of a file with that
+content. A file whose content was already analyzed by the same parser version therefore
+costs a stat and a hash instead of a parse, wherever it is located. Bumping a parser's
+parser_version starts a fresh cache directory for it.
+"""
+import json
+import os
+from typing import Any
+from tools._utils import atomic_write_text
+from tools.artifact_store import hash_file
+from tools.parsers.base_parser import BaseParser
+
+
+METRICS_CACHE_DIR_NAME = os.path.join("cache", "code_metrics")
+
+
+class MetricsCache:
+    """On-disk FileMetrics cache of one .assistant directory, with hit/miss counters."""
+    
+    def __init__(self, assistant_dir: str):
+        """
+        Args:
+            assistant_dir: Path to the .assistant directory holding the cache.
+        """
+        self.cache_dir = os.path.join(assistant_dir, METRICS_CACHE_DIR_NAME)
+        self.hits = 0
+        self.misses = 0
+        self.write_errors = 0
+    
+    def get_entry_path(self, parser: BaseParser, digest: str) -> str:
+        """Path of the cache entry for a file content digest, as analyzed by a parser."""
+        parser_dir = f"{parser.language_name}-v{parser.parser_version}"
+        return os.path.join(self.cache_dir, parser_dir, digest[:2], f"{digest}.json")
+    
+    def lookup(self, file_path: str, parser: BaseParser) -> tuple[dict[str, Any] | None, str | None]:
+        """
+        Get the cached metrics of a file.
+        
+        Args:
+            file_path: Absolute path of the file.
+            parser: The parser that analyzes the file.
+        
+        Returns:
+            A tuple of (metrics, entry_path): metrics is None on a miss, and entry_path is where
+            to store the metrics once computed (None if the file could not be hashed).
+        """
+        try:
+            entry_path = self.get_entry_path(parser, hash_file(file_path))
+        except OSError:
+            self.misses += 1
+            return None, None
+        
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                metrics = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None, entry_path
+        
+        # The same content may have been analyzed under another path
+        metrics["path"] = file_path
+        self.hits += 1
+        return metrics, entry_path
+    
+    def store(self, entry_path: str, metrics: dict[str, Any]) -> None:
+        """
+        Save the metrics computed for a cache miss; failures only make the next lookup miss again.
+        
+        Args:
+            entry_path: Entry path returned by lookup.
+            metrics: The file's FileMetrics as a dict.
+        """
+        try:
+            os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+            atomic_write_text(entry_path, json.dumps(metrics))
+        except OSError:
+            self.write_errors += 1
+    
+    def describe(self) -> str:
+        """Summarize the counters for the response context."""
+        total = self.hits + self.misses
+        hit_rate = f"{self.hits / total:.0%}" if total else "n/a"
+        description = f"Metrics cache: {self.hits} hit(s), {self.misses} miss(es), hit rate {hit_rate} ({self.cache_dir})"
+        if self.write_errors:
+            description += f", {self.write_errors} entry(ies) could not be written"
+        return description
@@ -21,6 +21,16 @@ class BaseParser(ABC):
         """Return supported file extensions (e.g., ('.py',), ('.cs',))."""
         pass
     
+    @property
+    def parser_version(self) -> str:
+        """
+        Return the version of the metrics this parser produces.
+        
+        Part of the key of cached metrics: bump it whenever a change makes the parser
+        produce different metrics for the same file.
+        """
+        return "1"
+    
     def can_parse(self, file_path: str) -> bool:
         """Check if this parser can handle the given file."""
         return file_path.lower().endswith(self.file_extensions)
@@ -2,9 +2,12 @@
 C#-specific code parser using regex-based parsing.
 """
 import re
+from bisect import bisect_left
+from dataclasses import dataclass, field
 from typing import List, Tuple, Optional, Dict, Any
 
 from tools.parsers.base_parser import BaseParser
+from tools.parsers.csharp_tokenizer import CSharpStructure, scan_structure
 from tools.parsers.shared_models import (
     FileMetrics,
     ClassMetrics,
@@ -13,33 +16,47 @@ from tools.parsers.shared_models import (
 )
 
 
+@dataclass
+class _ScanState:
+    """A C# file being scanned by CSharpParser._find_classes."""
+    content: str
+    lines: List[str]
+    newline_offsets: List[int]
+    structure: CSharpStructure
+    classes: List[ClassMetrics] = field(default_factory=list)
+
+
 class CSharpParser(BaseParser):
     """Parser for C# source files using regex-based parsing."""
     
     # Regex patterns for C# code elements
-    USING_PATTERN = re.compile(r'^\s*using\s+([\w.]+)\s*;', re.MULTILINE)
-    NAMESPACE_PATTERN = re.compile(r'^\s*namespace\s+([\w.]+)', re.MULTILINE)
+    USING_PATTERN = re.compile(r'^[ \t]*using\s+([\w.]+)\s*;', re.MULTILINE)
+    NAMESPACE_PATTERN = re.compile(r'^[ \t]*namespace\s+([\w.]+)', re.MULTILINE)
+    
+    # Declaration patterns are matched at line starts by _search_declaration. Their quantifiers are
+    # possessive and whitespace is consumed in one place only, so a match attempt never backtracks
+    # over the same text twice (linear time, even on generated or minified code).
     
     # Class/struct/interface pattern
     CLASS_PATTERN = re.compile(
-        r'^\s*(?P<access>public|private|protected|internal|protected\s+internal|private\s+protected)?\s*'
-        r'(?P<modifiers>(?:static|abstract|sealed|partial)\s+)*'
-        r'(?P<type>class|struct|interface|record)\s+'
-        r'(?P<name>\w+)\s*'
-        r'(?:<[^>]+>)?\s*'  # Generic type parameters
-        r'(?::\s*(?P<inheritance>[^{]+))?'  # Inheritance/interfaces
-        r'\s*\{',
+        r'^\s*+(?P<access>public|private|protected|internal|protected\s+internal|private\s+protected)?\s*+'
+        r'(?P<modifiers>(?:static|abstract|sealed|partial)\s++)*+'
+        r'(?P<type>class|struct|interface|record)\s++'
+        r'(?P<name>\w++)\s*+'
+        r'(?:<[^>]++>)?\s*+'  # Generic type parameters
+        r'(?::\s*+(?P<inheritance>[^{]++))?'  # Inheritance/interfaces
+        r'\s*+\{',
         re.MULTILINE
     )
     
     # Method pattern (including constructors)
     METHOD_PATTERN = re.compile(
-        r'^\s*(?P<access>public|private|protected|internal|protected\s+internal|private\s+protected)?\s*'
-        r'(?P<modifiers>(?:(?:static|virtual|override|abstract|sealed|async|extern|partial|new)\s+)*)'
-        r'(?P<return_type>[\w<>\[\],\s\.]+?)?\s+'
-        r'(?P<name>\w+)\s*'
-        r'(?:<[^>]+>)?\s*'  # Generic type parameters
-        r'\((?P<params>[^)]*)\)',
+        r'^\s*+(?:(?P<access>public|private|protected|internal|protected\s+internal|private\s+protected)\s++)?'
+        r'(?P<modifiers>(?:(?:static|virtual|override|abstract|sealed|async|extern|partial|new)\s++)*+)'
+        r'(?:(?P<return_type>[\w<>\[\],\.]++(?:\s++[\w<>\[\],\.]++)*?)\s++)??'
+        r'(?P<name>\w++)\s*+'
+        r'(?:<[\w\s,]*+>)?\s*+'  # Generic type parameters
+        r'\((?P<params>[^)]*+)\)',
         re.MULTILINE
     )
     
@@ -54,14 +71,18 @@ class CSharpParser(BaseParser):
     
     # Property pattern
     PROPERTY_PATTERN = re.compile(
-        r'^\s*(?P<access>public|private|protected|internal|protected\s+internal|private\s+protected)?\s*'
-        r'(?P<modifiers>(?:(?:static|virtual|override|abstract|sealed|new)\s+)*)'
-        r'(?P<type>[\w<>\[\],\s\.]+)\s+'
-        r'(?P<name>\w+)\s*'
+        r'^\s*+(?:(?P<access>public|private|protected|internal|protected\s+internal|private\s+protected)\s++)?'
+        r'(?P<modifiers>(?:(?:static|virtual|override|abstract|sealed|new)\s++)*+)'
+        r'(?P<type>[\w<>\[\],\.]++(?:\s++[\w<>\[\],\.]++)*?)\s++'
+        r'(?P<name>\w++)\s*+'
         r'(?:\{|=>)',
         re.MULTILINE
     )
     
+    # Characters a method or property declaration consists of, up to its '(', '{' or '=>'
+    DECLARATION_RUN_PATTERN = re.compile(r'[\w<>\[\],\.\s]*+')
+    WHITESPACE_RUN_PATTERN = re.compile(r'\s*+')
+    
     @property
     def language_name(self) -> str:
         return "csharp"
@@ -122,167 +143,277 @@ class CSharpParser(BaseParser):
             namespaces=namespaces
         )
     
+    def _build_line_index(self, content: str) -> List[int]:
+        """Return the offsets of all newlines in the content, in increasing order."""
+        return [match.start() for match in re.finditer('\n', content)]
+    
+    def _line_number(self, newline_offsets: List[int], pos: int) -> int:
+        """Return the 1-based line number of a position (same as content[:pos].count('\\n') + 1)."""
+        return bisect_left(newline_offsets, pos) + 1
+    
     def _find_classes(self, content: str, lines: List[str]) -> List[ClassMetrics]:
-        """Find all classes/structs/interfaces in the content."""
-        classes = []
-        
-        for match in self.CLASS_PATTERN.finditer(content):
-            class_name = match.group('name')
-            class_type = match.group('type')
-            access = match.group('access') or 'internal'  # Default in C#
-            modifiers = match.group('modifiers') or ''
-            inheritance = match.group('inheritance')
-            
-            # Calculate line number
-            line_start = content[:match.start()].count('\n') + 1
-            
-            # Find the closing brace to determine class end
-            class_start_pos = match.end() - 1  # Position of opening brace
-            class_end_pos = self._find_matching_brace(content, class_start_pos)
-            
-            if class_end_pos == -1:
-                # Couldn't find matching brace, estimate
-                line_end = line_start + 10
-            else:
-                line_end = content[:class_end_pos].count('\n') + 1
-            
-            # Get class content
-            class_content = content[match.start():class_end_pos + 1] if class_end_pos != -1 else ""
-            class_lines = lines[line_start - 1:line_end]
-            
-            # Parse inheritance
-            base_classes = []
-            interfaces = []
-            if inheritance:
-                parts = [p.strip() for p in inheritance.split(',')]
-                for part in parts:
-                    # In C#, interfaces typically start with 'I' by convention
-                    # But this isn't reliable, so we just collect them all
-                    if part.startswith('I') and len(part) > 1 and part[1].isupper():
-                        interfaces.append(part)
-                    else:
-                        base_classes.append(part)
-            
-            # Find methods within this class
-            methods = self._find_methods(class_content, lines, line_start)
-            
-            # Find constructor params
-            constructor_param_count = self._find_constructor_params(class_content, class_name)
-            
-            # Find properties
-            property_count = len(self.PROPERTY_PATTERN.findall(class_content))
-            
-            # Determine if abstract/static
-            is_abstract = 'abstract' in modifiers
-            is_static = 'static' in modifiers
-            
-            classes.append(ClassMetrics(
-                name=class_name,
-                line_start=line_start,
-                line_end=line_end,
-                line_count=line_end - line_start + 1,
-                constructor_param_count=constructor_param_count,
-                method_count=len(methods),
-                methods=methods,
-                line_stats=calculate_line_stats(class_lines),
-                access_modifier=access.replace('  ', ' ').strip(),
-                property_count=property_count,
-                is_abstract=is_abstract,
-                is_static=is_static,
-                base_classes=base_classes,
-                interfaces=interfaces
-            ))
-        
-        return classes
+        """
+        Find all classes/structs/interfaces in the content, with their members.
+        
+        Walks the block structure of the file once: each declaration header is matched against the
+        patterns a single time, members are attributed to their innermost type, and method and
+        property bodies are skipped.
+        """
+        state = _ScanState(
+            content=content,
+            lines=lines,
+            newline_offsets=self._build_line_index(content),
+            structure=scan_structure(content)
+        )
+        self._scan_block(state, 0, len(content), None)
+        return state.classes
     
-    def _find_methods(self, class_content: str, all_lines: List[str], class_start_line: int) -> List[MethodMetrics]:
-        """Find all methods within a class."""
-        methods = []
-        
-        for match in self.METHOD_PATTERN.finditer(class_content):
-            method_name = match.group('name')
-            return_type = match.group('return_type')
-            access = match.group('access') or 'private'  # Default in C#
-            modifiers = match.group('modifiers') or ''
-            params = match.group('params')
-            
-            # Skip if this looks like a constructor (no return type and name matches class)
-            if not return_type or return_type.strip() == '':
-                continue
-            
-            # Skip common false positives
-            if method_name in ('if', 'for', 'foreach', 'while', 'switch', 'catch', 'using', 'lock'):
-                continue
+    def _scan_block(self, state: _ScanState, start: int, end: int, owner: Optional[ClassMetrics]) -> None:
+        """
+        Scan the statements and blocks between start and end.
+        
+        Args:
+            state: The file being scanned.
+            start: Position where the block's content starts.
+            end: Position where the block's content ends.
+            owner: The type whose body this is, or None outside of types (e.g. in a namespace).
+        """
+        content = state.content
+        boundaries = state.structure.boundaries
+        brace_pairs = state.structure.brace_pairs
+        
+        header_start = start
+        index = bisect_left(boundaries, start)
+        
+        while index < len(boundaries) and boundaries[index] < end:
+            pos = boundaries[index]
             
-            # Skip property accessors
-            if method_name in ('get', 'set', 'add', 'remove'):
+            if content[pos] == ';':
+                # Statement without body: field, abstract method, expression-bodied member...
+                if owner is not None:
+                    self._add_member(state, owner, header_start, pos, None)
+                header_start = pos + 1
+                index += 1
                 continue
             
-            # Calculate line number relative to class
-            relative_line = class_content[:match.start()].count('\n')
-            line_start = class_start_line + relative_line
-            
-            # Find method end (look for closing brace or semicolon for abstract/extern)
-            method_start_pos = match.end()
-            remaining = class_content[method_start_pos:]
-            
-            # Look for opening brace or semicolon
-            brace_pos = remaining.find('{')
-            semi_pos = remaining.find(';')
+            body_end = brace_pairs.get(pos, -1)
+            class_match = self._search_declaration(
+                content, self.CLASS_PATTERN, self.WHITESPACE_RUN_PATTERN, header_start, pos + 1
+            )
             
-            if semi_pos != -1 and (brace_pos == -1 or semi_pos < brace_pos):
-                # Abstract/extern method ending with semicolon
-                line_end = line_start
-            elif brace_pos != -1:
-                # Method with body
-                body_start = method_start_pos + brace_pos
-                body_end = self._find_matching_brace(class_content, body_start)
+            if class_match:
+                class_metrics = self._add_class(state, class_match, body_end)
                 if body_end != -1:
-                    line_end = class_start_line + class_content[:body_end].count('\n')
-                else:
-                    line_end = line_start + 5  # Estimate
-            else:
-                line_end = line_start
-            
-            # Count parameters
-            arg_count = self._count_parameters(params)
+                    self._scan_block(state, pos + 1, body_end, class_metrics)
+                    class_metrics.method_count = len(class_metrics.methods)
+            elif owner is None or not self._add_member(state, owner, header_start, pos, body_end):
+                # Namespaces and other blocks that aren't members: look inside with the same owner
+                if body_end != -1:
+                    self._scan_block(state, pos + 1, body_end, owner)
             
-            # Get method lines
-            method_lines = all_lines[line_start - 1:line_end] if line_end <= len(all_lines) else []
+            if body_end == -1:
+                header_start = pos + 1
+                index += 1
+            else:
+                header_start = body_end + 1
+                index = bisect_left(boundaries, body_end, index)
+    
+    def _search_declaration(
+        self,
+        content: str,
+        pattern: 're.Pattern[str]',
+        run_pattern: 're.Pattern[str]',
+        start: int,
+        end: int
+    ) -> Optional['re.Match[str]']:
+        """
+        Find the first line start in [start, end) where a declaration pattern matches.
+        
+        Same result as pattern.search(content, start, end), in linear time: when an attempt fails,
+        the line starts within the run of characters it began with (matched by run_pattern) would
+        fail the same way, so the search resumes at the first line after that run.
+        
+        Args:
+            content: The C# source.
+            pattern: A declaration pattern anchored with '^'.
+            run_pattern: Pattern of the characters any match attempt can start with.
+            start: Position to search from.
+            end: Position to search up to.
+        
+        Returns:
+            The first match, or None.
+        """
+        pos = start
+        while pos < end:
+            if pos and content[pos - 1] != '\n':
+                pos = content.find('\n', pos, end) + 1
+                if not pos:
+                    return None
+                continue
             
-            # Check modifiers
-            is_async = 'async' in modifiers
-            is_static = 'static' in modifiers
+            match = pattern.match(content, pos, end)
+            if match:
+                return match
             
-            methods.append(MethodMetrics(
-                name=method_name,
-                line_start=line_start,
-                line_end=line_end,
-                line_count=max(1, line_end - line_start + 1),
-                arg_count=arg_count,
-                line_stats=calculate_line_stats(method_lines),
-                access_modifier=access.replace('  ', ' ').strip(),
-                return_type=return_type.strip() if return_type else None,
-                is_async=is_async,
-                is_static=is_static
-            ))
-        
-        return methods
+            run_end = run_pattern.match(content, pos, end).end()
+            pos = content.find('\n', run_end, end) + 1
+            if not pos:
+                return None
+        
+        return None
     
-    def _find_constructor_params(self, class_content: str, class_name: str) -> int:
-        """Find the constructor parameter count for a class."""
-        # Look for constructor pattern matching the class name
-        pattern = re.compile(
-            rf'^\s*(?:public|private|protected|internal)?\s*{re.escape(class_name)}\s*\(([^)]*)\)',
-            re.MULTILINE
+    def _add_class(self, state: _ScanState, match: 're.Match[str]', class_end_pos: int) -> ClassMetrics:
+        """Record a class/struct/interface declaration; its members are added while scanning its body."""
+        class_name = match.group('name')
+        access = match.group('access') or 'internal'  # Default in C#
+        modifiers = match.group('modifiers') or ''
+        inheritance = match.group('inheritance')
+        
+        # Calculate line number
+        line_start = self._line_number(state.newline_offsets, match.start())
+        
+        if class_end_pos == -1:
+            # Couldn't find matching brace, estimate
+            line_end = line_start + 10
+        else:
+            line_end = self._line_number(state.newline_offsets, class_end_pos)
+        
+        class_lines = state.lines[line_start - 1:line_end]
+        
+        # Parse inheritance
+        base_classes = []
+        interfaces = []
+        if inheritance:
+            parts = [p.strip() for p in inheritance.split(',')]
+            for part in parts:
+                # In C#, interfaces typically start with 'I' by convention
+                # But this isn't reliable, so we just collect them all
+                if part.startswith('I') and len(part) > 1 and part[1].isupper():
+                    interfaces.append(part)
+                else:
+                    base_classes.append(part)
+        
+        # Determine if abstract/static
+        is_abstract = 'abstract' in modifiers
+        is_static = 'static' in modifiers
+        
+        class_metrics = ClassMetrics(
+            name=class_name,
+            line_start=line_start,
+            line_end=line_end,
+            line_count=line_end - line_start + 1,
+            constructor_param_count=0,
+            method_count=0,
+            line_stats=calculate_line_stats(class_lines),
+            access_modifier=access.replace('  ', ' ').strip(),
+            is_abstract=is_abstract,
+            is_static=is_static,
+            base_classes=base_classes,
+            interfaces=interfaces
         )
+        state.classes.append(class_metrics)
+        return class_metrics
+    
+    def _add_member(
+        self,
+        state: _ScanState,
+        owner: ClassMetrics,
+        header_start: int,
+        terminator_pos: int,
+        body_end: Optional[int]
+    ) -> bool:
+        """
+        Record the method, constructor or property declared by a header of a type's body.
+        
+        Args:
+            state: The file being scanned.
+            owner: The type declaring the member.
+            header_start: Position where the declaration starts.
+            terminator_pos: Position of the '{' or ';' ending the declaration.
+            body_end: Position of the body's closing brace, -1 if it wasn't found, None for a ';'.
         
-        match = pattern.search(class_content)
+        Returns:
+            True if the header declares a method, constructor or property (even one that isn't counted).
+        """
+        content = state.content
+        
+        match = self._search_declaration(
+            content, self.METHOD_PATTERN, self.DECLARATION_RUN_PATTERN, header_start, terminator_pos
+        )
         if match:
-            params = match.group(1)
-            return self._count_parameters(params)
+            self._add_method(state, owner, match, body_end)
+            return True
         
-        return 0
+        if self._search_declaration(
+            content, self.PROPERTY_PATTERN, self.DECLARATION_RUN_PATTERN, header_start, terminator_pos + 1
+        ):
+            owner.property_count += 1
+            return True
+        
+        return False
+    
+    def _add_method(
+        self,
+        state: _ScanState,
+        owner: ClassMetrics,
+        match: 're.Match[str]',
+        body_end: Optional[int]
+    ) -> None:
+        """Record a method (or the first constructor's parameter count) from a METHOD_PATTERN match."""
+        method_name = match.group('name')
+        return_type = match.group('return_type')
+        access = match.group('access') or 'private'  # Default in C#
+        modifiers = match.group('modifiers') or ''
+        params = match.group('params')
+        
+        # No return type: a constructor if the name matches the class
+        if not return_type or return_type.strip() == '':
+            if method_name == owner.name and not owner.constructor_param_count:
+                owner.constructor_param_count = self._count_parameters(params)
+            return
+        
+        # Skip common false positives
+        if method_name in ('if', 'for', 'foreach', 'while', 'switch', 'catch', 'using', 'lock'):
+            return
+        
+        # Skip property accessors
+        if method_name in ('get', 'set', 'add', 'remove'):
+            return
+        
+        # Calculate line number
+        line_start = self._line_number(state.newline_offsets, match.start())
+        
+        if body_end is None:
+            # Abstract/extern or expression-bodied method ending with semicolon
+            line_end = line_start
+        elif body_end != -1:
+            # Method with body
+            line_end = self._line_number(state.newline_offsets, body_end)
+        else:
+            line_end = line_start + 5  # Estimate
+        
+        # Count parameters
+        arg_count = self._count_parameters(params)
+        
+        # Get method lines
+        method_lines = state.lines[line_start - 1:line_end] if line_end <= len(state.lines) else []
+        
+        # Check modifiers
+        is_async = 'async' in modifiers
+        is_static = 'static' in modifiers
+        
+        owner.methods.append(MethodMetrics(
+            name=method_name,
+            line_start=line_start,
+            line_end=line_end,
+            line_count=max(1, line_end - line_start + 1),
+            arg_count=arg_count,
+            line_stats=calculate_line_stats(method_lines),
+            access_modifier=access.replace('  ', ' ').strip(),
+            return_type=return_type.strip() if return_type else None,
+            is_async=is_async,
+            is_static=is_static
+        ))
     
     def _count_parameters(self, params_str: str) -> int:
         """Count the number of parameters in a parameter string."""
@@ -311,51 +442,4 @@ class CSharpParser(BaseParser):
         # Filter out 'this' for extension methods
         params = [p for p in params if not p.startswith('this ')]
         
-        return len(params)
-    
-    def _find_matching_brace(self, content: str, start_pos: int) -> int:
-        """Find the position of the closing brace matching the opening brace at start_pos."""
-        if start_pos >= len(content) or content[start_pos] != '{':
-            return -1
-        
-        depth = 1
-        pos = start_pos + 1
-        in_string = False
-        in_char = False
-        in_comment = False
-        in_block_comment = False
-        
-        while pos < len(content) and depth > 0:
-            char = content[pos]
-            prev_char = content[pos - 1] if pos > 0 else ''
-            next_char = content[pos + 1] if pos < len(content) - 1 else ''
-            
-            # Handle comments
-            if not in_string and not in_char:
-                if char == '/' and next_char == '/' and not in_block_comment:
-                    in_comment = True
-                elif char == '\n' and in_comment:
-                    in_comment = False
-                elif char == '/' and next_char == '*' and not in_comment:
-                    in_block_comment = True
-                elif char == '*' and next_char == '/' and in_block_comment:
-                    in_block_comment = False
-                    pos += 1
-            
-            # Handle strings and chars
-            if not in_comment and not in_block_comment:
-                if char == '"' and prev_char != '\\':
-                    in_string = not in_string
-                elif char == "'" and prev_char != '\\' and not in_string:
-                    in_char = not in_char
-            
-            # Count braces
-            if not in_string and not in_char and not in_comment and not in_block_comment:
-                if char == '{':
-                    depth += 1
-                elif char == '}':
-                    depth -= 1
-            
-            pos += 1
-        
-        return pos - 1 if depth == 0 else -1
\ No newline at end of file
+        return len(params)
\ No newline at end of file
@@ -0,0 +1,193 @@
+"""
+Lexical scanning of C# source: tells code apart from comments, char and string literals.
+"""
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+
+# Next construct of interest in code: comments, literals, braces and statement ends
+_CODE_TOKEN_PATTERN = re.compile(
+    r'(?P<line_comment>//)'
+    r'|(?P<block_comment>/\*)'
+    r"|(?P<char>')"
+    r'|(?P<string>(?P<prefix>\$+@?|@\$*)?(?P<quotes>"+))'
+    r'|(?P<brace>[{}])'
+    r'|(?P<semicolon>;)'
+)
+
+_CHAR_LITERAL_PATTERN = re.compile(r"'(?:\\.|[^'\\\n])*'?")
+
+# Body of a non-raw string up to its closing quote, an interpolation hole or (for regular strings) a newline,
+# keyed by (verbatim, interpolated)
+_STRING_BODY_PATTERNS = {
+    (False, False): re.compile(r'(?:\\.|[^"\\\n])*'),
+    (False, True): re.compile(r'(?:\\.|\{\{|\}\}|[^"\\\n{}])*'),
+    (True, False): re.compile(r'(?:""|[^"])*'),
+    (True, True): re.compile(r'(?:""|\{\{|\}\}|[^"{}])*'),
+}
+
+
+@dataclass
+class CSharpStructure:
+    """Block structure of a C# file, as found by scan_structure."""
+    # Position of each '{' -> position of its matching '}'
+    brace_pairs: Dict[int, int] = field(default_factory=dict)
+    # Positions of the '{' and ';' that open blocks and end statements, in order
+    # (interpolation holes excluded)
+    boundaries: List[int] = field(default_factory=list)
+
+
+class _StructureScanner:
+    """Single pass over a C# file that pairs up the braces of code and records statement boundaries."""
+    
+    def __init__(self, content: str):
+        self.content = content
+        self.structure = CSharpStructure()
+        self._open: List[int] = []
+        self._hole_depth = 0
+    
+    def scan_code(self, pos: int, in_hole: bool = False) -> int:
+        """
+        Scan code starting at pos, recording brace pairs and boundaries.
+        
+        Args:
+            pos: Position to start at.
+            in_hole: True when scanning an interpolation hole, which ends at its unmatched '}'.
+        
+        Returns:
+            The position after the hole's closing brace, or the end of the content.
+        """
+        content = self.content
+        pairs = self.structure.brace_pairs
+        boundaries = self.structure.boundaries
+        base_depth = len(self._open)
+        
+        while True:
+            match = _CODE_TOKEN_PATTERN.search(content, pos)
+            if match is None:
+                return len(content)
+            
+            kind = match.lastgroup
+            if kind == 'brace':
+                if match.group() == '{':
+                    self._open.append(match.start())
+                    if not self._hole_depth:
+                        boundaries.append(match.start())
+                elif in_hole and len(self._open) == base_depth:
+                    return match.end()
+                elif self._open:
+                    pairs[self._open.pop()] = match.start()
+                pos = match.end()
+            elif kind == 'semicolon':
+                if not self._hole_depth:
+                    boundaries.append(match.start())
+                pos = match.end()
+            elif kind == 'line_comment':
+                end = content.find('\n', match.end())
+                pos = len(content) if end == -1 else end
+            elif kind == 'block_comment':
+                end = content.find('*/', match.end())
+                pos = len(content) if end == -1 else end + 2
+            elif kind == 'char':
+                pos = _CHAR_LITERAL_PATTERN.match(content, match.start()).end()
+            else:
+                pos = self.scan_string(match)
+    
+    def scan_string(self, match: 're.Match[str]') -> int:
+        """
+        Skip a string literal, scanning the code of its interpolation holes.
+        
+        Handles regular, verbatim (@"..."), interpolated ($"...", $@"...") and raw
+        (triple-quoted, optionally $-prefixed) strings.
+        
+        Args:
+            match: The _CODE_TOKEN_PATTERN match of the string's opening.
+        
+        Returns:
+            The position after the string's closing quote(s).
+        """
+        content = self.content
+        prefix = match.group('prefix') or ''
+        quote_count = len(match.group('quotes'))
+        dollars = prefix.count('$')
+        verbatim = '@' in prefix
+        
+        if not verbatim and quote_count >= 3:
+            return self._scan_raw_string(match.end(), quote_count, dollars)
+        
+        if not verbatim and quote_count == 2:
+            # Empty string
+            return match.start('quotes') + 2
+        
+        body_pattern = _STRING_BODY_PATTERNS[(verbatim, dollars > 0)]
+        pos = match.start('quotes') + 1
+        
+        while True:
+            pos = body_pattern.match(content, pos).end()
+            if pos >= len(content):
+                return pos
+            
+            char = content[pos]
+            if char == '"':
+                return pos + 1
+            elif char == '{':
+                pos = self._scan_hole(pos + 1)
+            elif char == '}':
+                # Stray closing brace (invalid C#), keep going
+                pos += 1
+            else:
+                # Regular strings end at the line
+                return pos
+    
+    def _scan_hole(self, pos: int) -> int:
+        """Scan the code of an interpolation hole starting at pos; returns the position after it."""
+        self._hole_depth += 1
+        try:
+            return self.scan_code(pos, in_hole=True)
+        finally:
+            self._hole_depth -= 1
+    
+    def _scan_raw_string(self, pos: int, quote_count: int, dollars: int) -> int:
+        """Skip the body of a raw string literal whose opening delimiter ends at pos."""
+        content = self.content
+        delimiter = '"' * quote_count
+        
+        if not dollars:
+            end = content.find(delimiter, pos)
+            return len(content) if end == -1 else end + quote_count
+        
+        # Holes open with as many braces as the literal has dollar signs
+        pattern = re.compile(f'{delimiter}|\\{{{{{dollars},}}')
+        while True:
+            match = pattern.search(content, pos)
+            if match is None:
+                return len(content)
+            if match.group().startswith('"'):
+                return match.end()
+            
+            pos = self._scan_hole(match.end())
+            closing = 1
+            while closing < dollars and content.startswith('}', pos):
+                pos += 1
+                closing += 1
+
+
+def scan_structure(content: str) -> CSharpStructure:
+    """
+    Find the block structure of C# code in one pass over the file.
+    
+    Braces and semicolons inside comments, char literals and strings are ignored. The code of
+    interpolation holes is scanned too: its braces are paired like any other code, but its
+    braces and semicolons are not boundaries of the enclosing statement.
+    
+    Args:
+        content: The C# source.
+    
+    Returns:
+        CSharpStructure with the brace pairs (braces without a match are left out) and the
+        statement boundaries of the file.
+    """
+    scanner = _StructureScanner(content)
+    scanner.scan_code(0)
+    return scanner.structure
@@ -1,12 +1,20 @@
 import os
-import shutil
 import re
+import shutil
+import tempfile
+import time
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from mcp_object import mcp
-from config import BASE_NAME
+from config import ARTIFACT_DEDUP, BASE_NAME, PERSIST_WORKERS
 from response import GlyphMCPResponse
-from ._utils import get_next_number, validate_absolute_path
-from .reference_graph import update_reference_graph
-from typing import List
+from ._utils import atomic_write_text, copy_file_fast, reserve_numbers, validate_absolute_path
+from ._aho_corasick import AhoCorasickMatcher
+from .artifact_store import persist_to_blob_store
+from .reference_graph import invalidate_reference_graph, update_reference_graph
+from .reference_refresh import schedule_reference_graph_refresh
+from typing import Any, List
 
 
 def validate_source_file(source_file_path: str, response: GlyphMCPResponse[None]) -> bool:
@@ -59,81 +67,142 @@ def get_and_validate_dirs(abs_path: str, response: GlyphMCPResponse[None]) -> tu
     return ad_hoc_dir, artifacts_dir
 
 
-def copy_artifact(source_file_path: str, artifacts_dir: str) -> tuple[str, str]:
+@dataclass
+class PersistJob:
+    """State and outcome of persisting one file."""
+    file_name: str
+    source_file_path: str
+    status: str = "pending"
+    artifact: str | None = None
+    bytes: int = 0
+    duration_seconds: float = 0.0
+    copy_strategy: str | None = None
+    error: str | None = None
+    staging_path: str | None = None
+    
+    def to_dict(self) -> dict[str, Any]:
+        """Describe the outcome for clients."""
+        return {
+            "file": self.file_name,
+            "status": self.status,
+            "artifact": self.artifact,
+            "bytes": self.bytes,
+            "duration_seconds": round(self.duration_seconds, 4),
+            "copy_strategy": self.copy_strategy,
+            "error": self.error
+        }
+
+
+def get_artifact_filename(source_file_path: str, number: int) -> str:
     """
-    Copy the source file to the artifacts directory with proper naming.
+    Build the artifact filename of a source file.
     
     Args:
         source_file_path: Path to the source file.
-        artifacts_dir: Path to the artifacts directory.
+        number: The artifact's serial number.
     
     Returns:
-        A tuple of (new_filename, new_filepath).
+        The filename art_{number}_{original_file_name}, with spaces replaced by underscores.
+    """
+    # Extract the original filename and replace spaces with underscores
+    sanitized_filename = os.path.basename(source_file_path).replace(' ', '_')
+    
+    return f"art_{number}_{sanitized_filename}"
+
+
+def stage_artifact(job: PersistJob, staging_dir: str, allow_move: bool = False) -> PersistJob:
     """
-    # Get the next artifact number (using 'art' prefix, accepting any extension)
-    next_number = get_next_number(artifacts_dir, "art", extension="")
+    Copy a source file into the staging directory, recording size, duration and outcome on the job.
     
-    # Extract the original filename
-    original_filename = os.path.basename(source_file_path)
+    With GLYPH_ARTIFACT_DEDUP enabled, the content goes to the blob store and the staged file is a link to it.
     
-    # Replace spaces with underscores in the filename
-    sanitized_filename = original_filename.replace(' ', '_')
+    Args:
+        job: The job of the file to copy (status 'pending').
+        staging_dir: Directory on the same filesystem as the artifacts directory.
+        allow_move: True if the source file will be deleted after the copy (enables hardlinking).
     
-    # Create the new artifact filename
-    new_filename = f"art_{next_number}_{sanitized_filename}"
-    new_filepath = os.path.join(artifacts_dir, new_filename)
+    Returns:
+        The job, with status 'staged' or 'failed'.
+    """
+    start = time.perf_counter()
     
-    # Copy the file to artifacts directory
-    shutil.copy2(source_file_path, new_filepath)
+    try:
+        job.bytes = os.path.getsize(job.source_file_path)
+        job.staging_path = os.path.join(staging_dir, f"{id(job)}_{os.path.basename(job.source_file_path)}")
+        
+        if ARTIFACT_DEDUP:
+            assistant_dir = os.path.dirname(staging_dir)
+            job.copy_strategy = persist_to_blob_store(assistant_dir, job.source_file_path, job.staging_path, allow_move)
+        else:
+            job.copy_strategy = copy_file_fast(job.source_file_path, job.staging_path, allow_move)
+        
+        job.status = "staged"
+    except Exception as e:
+        job.status = "failed"
+        job.error = str(e)
     
-    return new_filename, new_filepath
+    job.duration_seconds = time.perf_counter() - start
+    return job
 
 
-def fix_references_in_file(file_path: str, old_filename: str, new_filename: str) -> int:
+def fix_references_in_file(file_path: str, matcher: AhoCorasickMatcher, renames: dict[str, str]) -> dict[str, int]:
     """
-    Replace all references to old_filename with new_filename in a file.
+    Replace all references to the renamed files in a file, in a single pass.
+    
+    Occurrences are replaced leftmost first, preferring the longest old filename at a position,
+    so an old filename that is part of another one (e.g. 'a.md' in 'data.md') is not mangled.
+    The file is written at most once, atomically.
     
     Args:
         file_path: Path to the file to update.
-        old_filename: The original filename to search for.
-        new_filename: The new filename to replace with.
+        matcher: Matcher built from the old filenames.
+        renames: Dict mapping each old filename to its new filename.
     
     Returns:
-        Number of replacements made.
+        Dictionary mapping old filenames to the number of replacements made.
     """
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
-        # Count occurrences before replacement
-        count = content.count(old_filename)
+        # Cheap check first: most files reference none of the renamed files
+        if not any(old_filename in content for old_filename in renames):
+            return {}
         
-        if count > 0:
-            # Replace all occurrences
-            new_content = content.replace(old_filename, new_filename)
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+        counts = {}
+        parts = []
+        position = 0
+        for start, old_filename in matcher.iter_matches(content):
+            parts.append(content[position:start])
+            parts.append(renames[old_filename])
+            position = start + len(old_filename)
+            counts[old_filename] = counts.get(old_filename, 0) + 1
+        
+        if counts:
+            parts.append(content[position:])
+            atomic_write_text(file_path, "".join(parts))
         
-        return count
+        return counts
     except Exception:
         # Silently skip files that can't be read/written
-        return 0
+        return {}
 
 
-def fix_references_in_directories(assistant_dir: str, old_filename: str, new_filename: str) -> dict[str, int]:
+def fix_references_in_directories(assistant_dir: str, renames: dict[str, str]) -> dict[str, dict[str, int]]:
     """
-    Fix all references to old_filename in design_logs, operations, and artifacts directories.
+    Fix all references to renamed files in design_logs, operations, and artifacts directories.
+    
+    All renames are applied in one walk over the directories.
     
     Args:
         assistant_dir: Path to the .assistant directory.
-        old_filename: The original filename to search for.
-        new_filename: The new filename to replace with.
+        renames: Dict mapping each old filename to its new filename.
     
     Returns:
-        Dictionary mapping file paths to number of replacements made.
+        Dictionary mapping each old filename to a dictionary of file paths and the number of replacements made.
     """
-    replacements = {}
+    replacements = {old_filename: {} for old_filename in renames}
+    matcher = AhoCorasickMatcher(renames)
     
     for dir_name in ["design_logs", "operations", "artifacts"]:
         dir_path = os.path.join(assistant_dir, dir_name)
@@ -144,10 +213,10 @@ def fix_references_in_directories(assistant_dir: str, old_filename: str, new_fil
         for root, dirs, files in os.walk(dir_path):
             for filename in files:
                 file_path = os.path.join(root, filename)
-                count = fix_references_in_file(file_path, old_filename, new_filename)
+                counts = fix_references_in_file(file_path, matcher, renames)
                 
-                if count > 0:
-                    replacements[file_path] = count
+                for old_filename, count in counts.items():
+                    replacements[old_filename][file_path] = count
     
     return replacements
 
@@ -157,25 +226,35 @@ def persist_artifacts(
     abs_path: str, 
     files: List[str],
     delete_from_ad_hoc: bool,
-    fix_references: bool
-) -> GlyphMCPResponse[None]:
+    fix_references: bool,
+    refresh_in_background: bool = False,
+    max_workers: int | None = None
+) -> GlyphMCPResponse[list[dict[str, Any]]]:
     """
     Persist files from the ad_hoc directory to the artifacts directory.
     
     Copies each file to the .assistant/artifacts/ directory and renames it with the pattern:
     art_{serial_number}_{original_file_name}.{original_extension}
     
+    Files are first copied to a staging directory (concurrently if max_workers > 1), then numbered
+    and moved into artifacts in the order of `files`, so numbering does not depend on copy timing.
+    
     Args:
         abs_path: The absolute path of the project's root where the .assistant folder is located. Absolute path is required.
         files: List of filenames to persist (excluding path, assumed to be in `.assistant/ad_hoc` dir).
         delete_from_ad_hoc: If True, delete the original files from ad_hoc directory after persisting.
         fix_references: If True, automatically scan all files in design_logs, operations, and artifacts directories 
                        and update any references from the old ad_hoc filename to the new artifact filename.
+        refresh_in_background: If True, return right after copying and schedule the reference graph update
+                               in the background (poll get_reference_graph_status for completion).
+                               Refreshes requested while one is running are merged into a single rebuild.
+        max_workers: Number of threads copying files. Defaults to the server's configured value; 1 copies serially.
     
     Returns:
-        GlyphMCPResponse indicating success or failure, with the new artifact filenames.
+        GlyphMCPResponse with one result per requested file: file, status ('persisted', 'skipped' or 'failed'),
+        artifact (new filename), bytes, duration_seconds (copy time), copy_strategy and error.
     """
-    response = GlyphMCPResponse[None]()
+    response = GlyphMCPResponse[list[dict[str, Any]]]()
     
     if not validate_absolute_path(abs_path, response):
         return response
@@ -191,49 +270,108 @@ def persist_artifacts(
             response.add_context("No files specified to persist.")
             return response
         
-        for file_name in files:
-            source_file_path = os.path.join(ad_hoc_dir, file_name)
-            
-            # Validate source file
-            if not validate_source_file(source_file_path, response):
-                continue  # Skip invalid files but continue with others
+        if max_workers is not None and max_workers < 1:
+            response.add_context(f"max_workers must be >= 1, got {max_workers}")
+            return response
+        
+        max_workers = max_workers or PERSIST_WORKERS
+        assistant_dir = os.path.join(abs_path, BASE_NAME)
+        
+        # Validate all sources first
+        jobs = [PersistJob(file_name, os.path.join(ad_hoc_dir, file_name)) for file_name in files]
+        seen = set()
+        for job in jobs:
+            if not validate_source_file(job.source_file_path, response):
+                # Skip invalid files but continue with others
+                job.status = "skipped"
+                job.error = response.context[-1]
+            elif delete_from_ad_hoc and job.file_name in seen:
+                # The first occurrence moves the file away
+                job.status = "skipped"
+                job.error = f"{job.file_name} is listed more than once"
+                response.add_context(f"Skipping duplicate entry: {job.file_name}")
+            seen.add(job.file_name)
+        
+        # Copy the valid files into a staging directory next to artifacts
+        pending_jobs = [job for job in jobs if job.status == "pending"]
+        staging_dir = tempfile.mkdtemp(prefix=".persist_staging_", dir=assistant_dir)
+        try:
+            if max_workers > 1 and len(pending_jobs) > 1:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    list(executor.map(lambda job: stage_artifact(job, staging_dir, delete_from_ad_hoc), pending_jobs))
+            else:
+                for job in pending_jobs:
+                    stage_artifact(job, staging_dir, delete_from_ad_hoc)
             
-            # Copy the artifact
-            new_filename, new_filepath = copy_artifact(source_file_path, artifacts_dir)
+            # Commit in request order: number, move into artifacts, delete originals
+            staged_count = sum(1 for job in jobs if job.status == "staged")
+            renames: dict[str, str] = {}
+            numbers = reserve_numbers(artifacts_dir, "art", extension="", count=staged_count) if staged_count else nullcontext(1)
             
-            # Add success context
-            response.add_context(f"Persisted artifact: {new_filename}")
-            response.add_context(f"Source: {source_file_path}")
-            response.add_context(f"Destination: {new_filepath}")
+            with numbers as next_number:
+                for job in jobs:
+                    if job.status == "failed":
+                        response.add_context(f"Failed to persist {job.file_name}: {job.error}")
+                    if job.status != "staged":
+                        continue
+                    
+                    new_filename = get_artifact_filename(job.source_file_path, next_number)
+                    new_filepath = os.path.join(artifacts_dir, new_filename)
+                    os.replace(job.staging_path, new_filepath)
+                    next_number += 1
+                    
+                    job.status = "persisted"
+                    job.artifact = new_filename
+                    
+                    # Add success context
+                    response.add_context(f"Persisted artifact: {new_filename}")
+                    response.add_context(f"Source: {job.source_file_path}")
+                    response.add_context(f"Destination: {new_filepath}")
+                    response.add_context(f"Copy strategy: {job.copy_strategy}")
+                    
+                    # Collect renames; references are fixed for all files at once below
+                    renames.setdefault(job.file_name, new_filename)
+                    
+                    # Delete original file if requested
+                    if delete_from_ad_hoc:
+                        try:
+                            os.remove(job.source_file_path)
+                            response.add_context(f"Deleted original file from ad_hoc: {job.file_name}")
+                        except Exception as e:
+                            response.add_context(f"Warning: Failed to delete original file {job.file_name}: {str(e)}")
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+        
+        response.result = [job.to_dict() for job in jobs]
+        
+        # Fix references if requested, in a single pass over the workspace
+        if fix_references and renames:
+            replacements = fix_references_in_directories(assistant_dir, renames)
             
-            # Fix references if requested
-            if fix_references:
-                assistant_dir = os.path.join(abs_path, BASE_NAME)
-                replacements = fix_references_in_directories(assistant_dir, file_name, new_filename)
-                
-                if replacements:
+            for file_name, new_filename in renames.items():
+                if replacements[file_name]:
                     response.add_context(f"Fixed references to '{file_name}' -> '{new_filename}':")
-                    for ref_file, count in replacements.items():
+                    for ref_file, count in replacements[file_name].items():
                         rel_path = os.path.relpath(ref_file, abs_path)
                         response.add_context(f"  - {rel_path}: {count} replacement(s)")
                 else:
                     response.add_context(f"No references to '{file_name}' found to fix")
-            
-            # Delete original file if requested
-            if delete_from_ad_hoc:
-                try:
-                    os.remove(source_file_path)
-                    response.add_context(f"Deleted original file from ad_hoc: {file_name}")
-                except Exception as e:
-                    response.add_context(f"Warning: Failed to delete original file {file_name}: {str(e)}")
-        
-        # Update reference graph after persisting artifacts
-        update_response = update_reference_graph(abs_path)
-        if not update_response.success:
-            response.add_context("Warning: Failed to update reference graph after persisting artifacts")
-            response.add_context(update_response.context)
+        
+        # Drop the cached graph, then rebuild it from the new workspace state
+        invalidate_reference_graph(abs_path)
+        if refresh_in_background:
+            if schedule_reference_graph_refresh(assistant_dir):
+                response.add_context("Reference graph update scheduled in the background")
+            else:
+                response.add_context("Reference graph update merged into the refresh already in progress")
+            response.add_context("Use get_reference_graph_status to check when it is done")
         else:
-            response.add_context("Reference graph updated successfully")
+            update_response = update_reference_graph(abs_path)
+            if not update_response.success:
+                response.add_context("Warning: Failed to update reference graph after persisting artifacts")
+                response.add_context(update_response.context)
+            else:
+                response.add_context("Reference graph updated successfully")
         
         response.success = True
         
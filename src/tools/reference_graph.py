@@ -1,9 +1,237 @@
 import os
 import csv
+import json
+import hashlib
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass, field
+from typing import Any, Literal
 from mcp_object import mcp
-from config import BASE_NAME
+from config import BASE_NAME, REFERENCE_GRAPH_BACKEND, REFERENCE_SCAN_WORKERS
 from response import GlyphMCPResponse
 from ._utils import validate_absolute_path
+from ._aho_corasick import AhoCorasickMatcher
+from . import _reference_db
+
+
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class ReferenceScanResult:
+    """Outcome of scanning the workspace for references."""
+    edges: list[tuple[str, str]]
+    file_to_dir: dict[str, str]
+    manifest: dict[str, Any]
+    file_count: int = 0
+    scanned_count: int = 0  # Files matched against all targets (new or changed content)
+    rechecked_count: int = 0  # Unchanged files matched against newly added targets only
+    edge_ranges: dict[str, tuple[int, int]] = field(default_factory=dict)  # rel_path -> (start, end) slice of edges
+
+
+class ReferenceGraph:
+    """
+    In-memory reference graph.
+    
+    File names are interned to integer node IDs; adjacency is kept as forward (references from)
+    and reverse (references to) sets, along with each node's directory type.
+    """
+    
+    def __init__(self, signature: dict[str, tuple[int, int]] | None = None):
+        """
+        Args:
+            signature: The (size, mtime_ns) signature of the files the graph was built from.
+        """
+        self.signature = signature or {}
+        self._node_ids: dict[str, int] = {}
+        self._names: list[str] = []
+        self._dir_types: list[str | None] = []
+        self._forward: list[set[int]] = []
+        self._reverse: list[set[int]] = []
+    
+    @classmethod
+    def from_edges(
+        cls,
+        edges: list[tuple[str, str]],
+        file_to_dir: dict[str, str],
+        signature: dict[str, tuple[int, int]]
+    ) -> "ReferenceGraph":
+        """
+        Build a graph from reference edges.
+        
+        Args:
+            edges: List of edge tuples (source_file, referenced_file).
+            file_to_dir: Dict mapping filename to its directory type.
+            signature: The file signature the edges were built from.
+        
+        Returns:
+            The reference graph.
+        """
+        graph = cls(signature)
+        for filename, dir_type in file_to_dir.items():
+            graph.add_node(filename, dir_type)
+        for source, target in edges:
+            graph.add_edge(source, target)
+        return graph
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self._node_ids
+    
+    def __len__(self) -> int:
+        return len(self._names)
+    
+    def add_node(self, name: str, dir_type: str | None = None) -> int:
+        """
+        Intern a file name, returning its node ID.
+        
+        Args:
+            name: The file name.
+            dir_type: The directory the file belongs to, if known.
+        
+        Returns:
+            The node ID.
+        """
+        node_id = self._node_ids.get(name)
+        if node_id is None:
+            node_id = len(self._names)
+            self._node_ids[name] = node_id
+            self._names.append(name)
+            self._dir_types.append(dir_type)
+            self._forward.append(set())
+            self._reverse.append(set())
+        elif dir_type is not None:
+            self._dir_types[node_id] = dir_type
+        return node_id
+    
+    def add_edge(self, source: str, target: str) -> None:
+        """Add a directed reference edge from source to target."""
+        source_id = self.add_node(source)
+        target_id = self.add_node(target)
+        self._forward[source_id].add(target_id)
+        self._reverse[target_id].add(source_id)
+    
+    def node_id(self, name: str) -> int | None:
+        """Get the node ID of a file name, or None if it is not in the graph."""
+        return self._node_ids.get(name)
+    
+    def name(self, node_id: int) -> str:
+        """Get the file name of a node ID."""
+        return self._names[node_id]
+    
+    def dir_type(self, name: str) -> str | None:
+        """Get the directory type (design_logs, operations, artifacts) of a file, if known."""
+        node_id = self._node_ids.get(name)
+        return self._dir_types[node_id] if node_id is not None else None
+    
+    def successors(self, node_id: int) -> set[int]:
+        """Get the node IDs referenced by a node."""
+        return self._forward[node_id]
+    
+    def predecessors(self, node_id: int) -> set[int]:
+        """Get the node IDs referencing a node."""
+        return self._reverse[node_id]
+    
+    def _names_of(self, node_ids: set[int]) -> list[str]:
+        # Node IDs follow first appearance, so sorting them gives a stable order
+        return [self._names[node_id] for node_id in sorted(node_ids)]
+    
+    def references_from(self, name: str) -> list[str]:
+        """Get the files referenced by a file."""
+        node_id = self._node_ids.get(name)
+        return self._names_of(self._forward[node_id]) if node_id is not None else []
+    
+    def references_to(self, name: str) -> list[str]:
+        """Get the files referencing a file."""
+        node_id = self._node_ids.get(name)
+        return self._names_of(self._reverse[node_id]) if node_id is not None else []
+    
+    def traverse(self, name: str, reverse: bool = False, max_depth: int | None = None) -> dict[str, int]:
+        """
+        Breadth-first traversal from a file.
+        
+        Args:
+            name: The file to start from.
+            reverse: If False, follow references from files; if True, follow references to them.
+            max_depth: Maximum number of hops, or None for the full transitive closure.
+        
+        Returns:
+            Dict mapping each reached file (excluding the start) to its hop distance, in BFS order.
+        """
+        start_id = self._node_ids.get(name)
+        if start_id is None:
+            return {}
+        
+        adjacency = self._reverse if reverse else self._forward
+        distances = {start_id: 0}
+        queue = deque([start_id])
+        
+        while queue:
+            node_id = queue.popleft()
+            distance = distances[node_id]
+            if max_depth is not None and distance >= max_depth:
+                continue
+            for next_id in sorted(adjacency[node_id]):
+                if next_id not in distances:
+                    distances[next_id] = distance + 1
+                    queue.append(next_id)
+        
+        del distances[start_id]
+        return {self._names[node_id]: distance for node_id, distance in distances.items()}
+    
+    def shortest_path(self, source: str, target: str) -> list[str] | None:
+        """
+        Find the shortest chain of references leading from source to target.
+        
+        Args:
+            source: The file to start from.
+            target: The file to reach.
+        
+        Returns:
+            List of files from source to target (both included), or None if target is unreachable.
+        """
+        source_id = self._node_ids.get(source)
+        target_id = self._node_ids.get(target)
+        if source_id is None or target_id is None:
+            return None
+        
+        parents = {source_id: source_id}
+        queue = deque([source_id])
+        
+        while queue and target_id not in parents:
+            node_id = queue.popleft()
+            for next_id in sorted(self._forward[node_id]):
+                if next_id not in parents:
+                    parents[next_id] = node_id
+                    queue.append(next_id)
+        
+        if target_id not in parents:
+            return None
+        
+        path = [target_id]
+        while path[-1] != source_id:
+            path.append(parents[path[-1]])
+        return [self._names[node_id] for node_id in reversed(path)]
+
+
+# Reference graphs cached per .assistant directory for the lifetime of the server
+_reference_graphs: dict[str, ReferenceGraph] = {}
+
+# Serializes rebuilds between tool calls and background watchers
+_reference_graph_lock = threading.RLock()
+
+
+def invalidate_reference_graph(abs_path: str) -> None:
+    """
+    Drop the cached reference graph of a project, so the next query re-validates it.
+    
+    Call this after any tool mutates design_logs, operations or artifacts.
+    
+    Args:
+        abs_path: The absolute path of the project's root where the .assistant folder is located.
+    """
+    _reference_graphs.pop(os.path.join(abs_path, BASE_NAME), None)
 
 
 def get_all_filenames(directory: str) -> list[str]:
@@ -23,30 +251,154 @@ def get_all_filenames(directory: str) -> list[str]:
     return filenames
 
 
-def find_file_references(file_path: str, target_filenames: list[str]) -> list[str]:
+def iter_workspace_files(assistant_dir: str):
     """
-    Find which target filenames are mentioned in a file.
+    Iterate over the files scanned for references, in a stable walk order.
     
     Args:
-        file_path: Path to the file to scan.
-        target_filenames: List of filenames to search for.
+        assistant_dir: Path to the .assistant directory.
+    
+    Yields:
+        Tuples of (dir_name, filename, file_path, rel_path).
+    """
+    for dir_name in ["design_logs", "operations", "artifacts"]:
+        directory = os.path.join(assistant_dir, dir_name)
+        if not os.path.exists(directory):
+            continue
+            
+        for root, dirs, files in os.walk(directory):
+            for filename in files:
+                # Skip _summary.md files as they trivially contain many filenames
+                if filename == "_summary.md":
+                    continue
+                
+                file_path = os.path.join(root, filename)
+                yield dir_name, filename, file_path, os.path.relpath(file_path, assistant_dir)
+
+
+def stat_signature(file_path: str) -> tuple[int, int]:
+    """
+    Get the (size, mtime_ns) signature of a file, or (-1, -1) if it cannot be stat-ed.
+    
+    Args:
+        file_path: Path to the file.
     
     Returns:
-        List of filenames that were found mentioned in the file.
+        Tuple of (size, mtime_ns).
     """
-    references = []
+    try:
+        stat_result = os.stat(file_path)
+    except OSError:
+        return -1, -1
+    return stat_result.st_size, stat_result.st_mtime_ns
+
+
+def snapshot_workspace(assistant_dir: str) -> dict[str, tuple[int, int]]:
+    """
+    Stat every scanned file without reading it.
     
+    Args:
+        assistant_dir: Path to the .assistant directory.
+    
+    Returns:
+        Dict mapping each file's path relative to assistant_dir to its (size, mtime_ns) signature.
+    """
+    return {
+        rel_path: stat_signature(file_path)
+        for _, _, file_path, rel_path in iter_workspace_files(assistant_dir)
+    }
+
+
+def manifest_signature(manifest: dict[str, Any]) -> dict[str, tuple[int, int]]:
+    """
+    Get the file signatures recorded in a manifest, comparable with snapshot_workspace().
+    
+    Args:
+        manifest: The reference graph manifest.
+    
+    Returns:
+        Dict mapping relative paths to their recorded (size, mtime_ns) signature.
+    """
+    return {rel_path: (entry["size"], entry["mtime_ns"]) for rel_path, entry in manifest.get("files", {}).items()}
+
+
+def read_scan_content(file_path: str) -> tuple[str | None, str | None]:
+    """
+    Read a file for reference scanning.
+    
+    Args:
+        file_path: Path to the file to read.
+    
+    Returns:
+        Tuple of (content, sha256) where content is None if the file is not valid UTF-8
+        and both are None if the file could not be read.
+    """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            for filename in target_filenames:
-                if filename in content:
-                    references.append(filename)
-    except Exception as e:
-        # Silently skip files that can't be read
-        pass
+        with open(file_path, 'rb') as f:
+            data = f.read()
+    except Exception:
+        return None, None
     
-    return references
+    digest = hashlib.sha256(data).hexdigest()
+    try:
+        return data.decode('utf-8'), digest
+    except UnicodeDecodeError:
+        # Binary files are hashed but never contain references
+        return None, digest
+
+
+def load_reference_manifest(manifest_path: str) -> dict[str, Any]:
+    """
+    Load the reference graph manifest.
+    
+    Args:
+        manifest_path: Path to the manifest JSON file.
+    
+    Returns:
+        The manifest, or an empty manifest if the file is missing, corrupt or from another version.
+    """
+    empty_manifest = {"version": MANIFEST_VERSION, "targets": [], "files": {}}
+    
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except Exception:
+        return empty_manifest
+    
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        return empty_manifest
+    
+    return manifest
+
+
+def write_reference_manifest(manifest_path: str, manifest: dict[str, Any]) -> None:
+    """
+    Write the reference graph manifest.
+    
+    Args:
+        manifest_path: Path to the manifest JSON file to create/update.
+        manifest: The manifest to write.
+    """
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f)
+
+
+def order_references(referenced_files: set[str], filename_positions: dict[str, list[int]], all_filenames: list[str]) -> list[str]:
+    """
+    Order found references the way they appear in the list of all filenames.
+    
+    Filenames listed more than once (e.g. the same name in two directories) are repeated accordingly.
+    
+    Args:
+        referenced_files: Set of filenames found in a file.
+        filename_positions: Dict mapping each filename to its positions in all_filenames.
+        all_filenames: List of all filenames that were searched for.
+    
+    Returns:
+        List of referenced filenames in target-list order.
+    """
+    positions = sorted(pos for filename in referenced_files for pos in filename_positions[filename])
+    return [all_filenames[pos] for pos in positions]
 
 
 def collect_all_filenames(assistant_dir: str) -> list[str]:
@@ -68,48 +420,148 @@ def collect_all_filenames(assistant_dir: str) -> list[str]:
     return all_filenames
 
 
-def build_reference_edges(assistant_dir: str, all_filenames: list[str]) -> tuple[list[tuple[str, str]], dict[str, str]]:
+def scan_file_references(
+    file_path: str,
+    previous: dict[str, Any] | None,
+    matcher: AhoCorasickMatcher,
+    added_matcher: AhoCorasickMatcher | None
+) -> tuple[set[str], str | None, str]:
+    """
+    Read a file and find the target filenames it mentions.
+    
+    If the content hash matches the previous manifest entry, the recorded references are reused and
+    the file is only matched against newly added targets.
+    
+    Args:
+        file_path: Path to the file to scan.
+        previous: The file's entry in the previous manifest, if any.
+        matcher: Automaton built from all target filenames.
+        added_matcher: Automaton built from targets added since the previous build, if any.
+    
+    Returns:
+        Tuple of (referenced_files, sha256, outcome) where outcome is 'scanned', 'rechecked' or 'reused'.
+    """
+    content, digest = read_scan_content(file_path)
+    
+    if previous is not None and digest is not None and digest == previous["sha256"]:
+        # Same content: only the newly added targets need checking
+        referenced_files = set(previous["references"])
+        if added_matcher is not None and content is not None:
+            referenced_files |= added_matcher.find_all(content)
+            return referenced_files, digest, "rechecked"
+        return referenced_files, digest, "reused"
+    
+    referenced_files = matcher.find_all(content) if content is not None else set()
+    return referenced_files, digest, "scanned"
+
+
+def build_reference_edges(
+    assistant_dir: str,
+    all_filenames: list[str],
+    previous_manifest: dict[str, Any] | None = None,
+    max_workers: int = 1
+) -> ReferenceScanResult:
     """
     Scan all files and build reference edges.
     
+    Files whose size and mtime (or content hash) match the previous manifest are not rescanned;
+    their references are reused, and only checked against targets added since the last build.
+    
     Args:
         assistant_dir: Path to the .assistant directory.
         all_filenames: List of all filenames to check for references.
+        previous_manifest: Manifest from the previous build, if any.
+        max_workers: Number of threads reading and scanning files. 1 scans serially.
+                     Results are merged in walk order either way.
     
     Returns:
-        Tuple of (edges, file_to_dir_mapping) where:
+        ReferenceScanResult with:
         - edges: List of tuples representing edges (source_file, referenced_file)
-        - file_to_dir_mapping: Dict mapping filename to its directory type
+        - file_to_dir: Dict mapping filename to its directory type
+        - manifest: The updated manifest to persist
     """
-    dirs_names = ["design_logs", "operations", "artifacts"]
+    previous_manifest = previous_manifest or {}
+    previous_files = previous_manifest.get("files", {})
     
-    edges = []
-    file_to_dir = {}
+    targets = set(all_filenames)
+    added_targets = targets - set(previous_manifest.get("targets", []))
     
-    for dir_name in dirs_names:
-        directory = os.path.join(assistant_dir, dir_name)
-        if not os.path.exists(directory):
-            continue
-            
-        for root, dirs, files in os.walk(directory):
-            for filename in files:
-                # Skip _summary.md files as they trivially contain many filenames
-                if filename == "_summary.md":
-                    continue
-                    
-                file_path = os.path.join(root, filename)
-                
-                # Track which directory this file belongs to
-                file_to_dir[filename] = dir_name
-                
-                referenced_files = find_file_references(file_path, all_filenames)
-                
-                # Add edges (excluding self-references)
-                for referenced_file in referenced_files:
-                    if referenced_file != filename:
-                        edges.append((filename, referenced_file))
+    result = ReferenceScanResult(
+        edges=[],
+        file_to_dir={},
+        manifest={"version": MANIFEST_VERSION, "targets": sorted(targets), "files": {}}
+    )
+    
+    # Phase 1: stat every file and decide which ones have to be read
+    files = []
+    pending = []
+    for dir_name, filename, file_path, rel_path in iter_workspace_files(assistant_dir):
+        size, mtime_ns = stat_signature(file_path)
+        previous = previous_files.get(rel_path)
+        stat_unchanged = previous is not None and previous["size"] == size and previous["mtime_ns"] == mtime_ns
+        
+        files.append((dir_name, filename, rel_path, size, mtime_ns, previous))
+        if not stat_unchanged or added_targets:
+            pending.append((len(files) - 1, file_path, previous))
     
-    return edges, file_to_dir
+    # Phase 2: read and match the pending files, possibly in parallel
+    scanned: dict[int, tuple[set[str], str | None, str]] = {}
+    if pending:
+        # Matchers are only built when something has to be read
+        matcher = AhoCorasickMatcher(all_filenames)
+        added_matcher = AhoCorasickMatcher(added_targets) if added_targets else None
+        
+        def scan(item: tuple[int, str, dict[str, Any] | None]) -> tuple[set[str], str | None, str]:
+            _, file_path, previous = item
+            return scan_file_references(file_path, previous, matcher, added_matcher)
+        
+        if max_workers > 1 and len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                outcomes = list(executor.map(scan, pending))
+        else:
+            outcomes = [scan(item) for item in pending]
+        
+        scanned = {item[0]: outcome for item, outcome in zip(pending, outcomes)}
+    
+    # Phase 3: merge in walk order, so the edge order does not depend on scheduling
+    filename_positions: dict[str, list[int]] = {}
+    for pos, filename in enumerate(all_filenames):
+        filename_positions.setdefault(filename, []).append(pos)
+    
+    for position, (dir_name, filename, rel_path, size, mtime_ns, previous) in enumerate(files):
+        # Track which directory this file belongs to
+        result.file_to_dir[filename] = dir_name
+        result.file_count += 1
+        
+        if position in scanned:
+            referenced_files, digest, outcome = scanned[position]
+            if outcome == "scanned":
+                result.scanned_count += 1
+            elif outcome == "rechecked":
+                result.rechecked_count += 1
+        else:
+            referenced_files, digest = set(previous["references"]), previous["sha256"]
+        
+        # Drop references to files that no longer exist
+        referenced_files &= targets
+        
+        result.manifest["files"][rel_path] = {
+            "filename": filename,
+            "dir": dir_name,
+            "size": size,
+            "mtime_ns": mtime_ns,
+            "sha256": digest,
+            "references": sorted(referenced_files)
+        }
+        
+        # Add edges (excluding self-references)
+        first_edge = len(result.edges)
+        for referenced_file in order_references(referenced_files, filename_positions, all_filenames):
+            if referenced_file != filename:
+                result.edges.append((filename, referenced_file))
+        result.edge_ranges[rel_path] = (first_edge, len(result.edges))
+    
+    return result
 
 
 def write_reference_csv(csv_path: str, edges: list[tuple[str, str]]) -> None:
@@ -126,34 +578,56 @@ def write_reference_csv(csv_path: str, edges: list[tuple[str, str]]) -> None:
         writer.writerows(edges)
 
 
-def write_reference_mermaid(md_path: str, edges: list[tuple[str, str]], file_to_dir: dict[str, str]) -> None:
+def _mermaid_node_id(node: str) -> str:
+    """Sanitize a node name for Mermaid (replace special chars)."""
+    return node.replace(".", "_").replace("-", "_").replace(" ", "_")
+
+
+def consolidate_edges(edges: list[tuple[str, str]]) -> list[tuple[str, str, bool]]:
     """
-    Write reference edges as a Mermaid graph in a Markdown file.
+    Consolidate edges for display, merging each bidirectional pair into a single edge.
+    
+    Duplicate edges are dropped. Runs in linear time using set membership.
     
     Args:
-        md_path: Path to the Markdown file to create/update.
-        edges: List of edge tuples to write.
-        file_to_dir: Dict mapping filename to its directory type.
+        edges: List of edge tuples (source_file, referenced_file).
+    
+    Returns:
+        List of (source, target, is_bidirectional) tuples, in first-seen order.
     """
-    # Detect and consolidate bidirectional links
     edges_set = set(edges)
     bidirectional_pairs = set()
+    added_edges = set()
     consolidated_edges = []
     
     for source, target in edges:
-        # Check if reverse edge exists
-        reverse = (target, source)
         edge_pair = (min(source, target), max(source, target))
         
-        if reverse in edges_set and edge_pair not in bidirectional_pairs:
+        if (target, source) in edges_set and edge_pair not in bidirectional_pairs:
             # This is a bidirectional link - mark it and add only once
             bidirectional_pairs.add(edge_pair)
+            added_edges.add((source, target))
             consolidated_edges.append((source, target, True))  # True = bidirectional
-        elif (source, target) not in [(s, t) for s, t, _ in consolidated_edges]:
-            # Check if we haven't already added this as part of a bidirectional pair
-            reverse_pair = (min(target, source), max(target, source))
-            if reverse_pair not in bidirectional_pairs:
-                consolidated_edges.append((source, target, False))  # False = directional
+        elif (source, target) not in added_edges and edge_pair not in bidirectional_pairs:
+            # Not yet added, neither directly nor as part of a bidirectional pair
+            added_edges.add((source, target))
+            consolidated_edges.append((source, target, False))  # False = directional
+    
+    return consolidated_edges
+
+
+def iter_mermaid_lines(edges: list[tuple[str, str]], file_to_dir: dict[str, str]):
+    """
+    Generate the lines of the Mermaid graph for the reference edges.
+    
+    Args:
+        edges: List of edge tuples to render.
+        file_to_dir: Dict mapping filename to its directory type.
+    
+    Yields:
+        The Markdown lines, without line terminators.
+    """
+    consolidated_edges = consolidate_edges(edges)
     
     # Collect all unique nodes from consolidated edges
     nodes = set()
@@ -161,55 +635,205 @@ def write_reference_mermaid(md_path: str, edges: list[tuple[str, str]], file_to_
         nodes.add(source)
         nodes.add(target)
     
-    # Build Mermaid diagram
-    lines = ["```mermaid", "graph LR"]
+    yield "```mermaid"
+    yield "graph LR"
     
     # Add style classes
-    lines.append("    classDef designLog fill:#FFC0CB,stroke:#000,color:#000")
-    lines.append("    classDef operation fill:#006400,stroke:#000,color:#fff")
-    lines.append("    classDef artifact fill:#FF8C00,stroke:#000,color:#fff")
-    lines.append("")
+    yield "    classDef designLog fill:#FFC0CB,stroke:#000,color:#000"
+    yield "    classDef operation fill:#006400,stroke:#000,color:#fff"
+    yield "    classDef artifact fill:#FF8C00,stroke:#000,color:#fff"
+    yield ""
+    
+    node_classes = {"design_logs": "designLog", "operations": "operation", "artifacts": "artifact"}
     
     # Group nodes by directory and add them with styling
     for node in sorted(nodes):
         dir_type = file_to_dir.get(node)
         if dir_type:
-            # Sanitize node name for Mermaid (replace special chars)
-            safe_node = node.replace(".", "_").replace("-", "_").replace(" ", "_")
-            
-            # Determine class
-            if dir_type == "design_logs":
-                node_class = "designLog"
-            elif dir_type == "operations":
-                node_class = "operation"
-            elif dir_type == "artifacts":
-                node_class = "artifact"
-            else:
-                node_class = ""
+            safe_node = _mermaid_node_id(node)
+            node_class = node_classes.get(dir_type, "")
             
             # Add node definition with label
-            lines.append(f"    {safe_node}[\"{node}\"]")
+            yield f"    {safe_node}[\"{node}\"]"
             if node_class:
-                lines.append(f"    class {safe_node} {node_class}")
+                yield f"    class {safe_node} {node_class}"
     
-    lines.append("")
+    yield ""
     
     # Add edges (using --- for bidirectional, --> for directional)
     for source, target, is_bidirectional in consolidated_edges:
-        safe_source = source.replace(".", "_").replace("-", "_").replace(" ", "_")
-        safe_target = target.replace(".", "_").replace("-", "_").replace(" ", "_")
         arrow = " --- " if is_bidirectional else " --> "
-        lines.append(f"    {safe_source}{arrow}{safe_target}")
+        yield f"    {_mermaid_node_id(source)}{arrow}{_mermaid_node_id(target)}"
     
-    lines.append("```")
+    yield "```"
+
+
+def write_reference_mermaid(md_path: str, edges: list[tuple[str, str]], file_to_dir: dict[str, str]) -> None:
+    """
+    Write reference edges as a Mermaid graph in a Markdown file.
+    
+    Lines are streamed to the file rather than joined in memory first.
+    
+    Args:
+        md_path: Path to the Markdown file to create/update.
+        edges: List of edge tuples to write.
+        file_to_dir: Dict mapping filename to its directory type.
+    """
+    lines = iter_mermaid_lines(edges, file_to_dir)
     
-    # Write to file
     with open(md_path, 'w', encoding='utf-8') as f:
-        f.write("\n".join(lines))
+        # Newline-separated, without a trailing newline
+        f.write(next(lines))
+        for line in lines:
+            f.write("\n")
+            f.write(line)
+
+
+def _reference_db_path(assistant_dir: str) -> str:
+    """Path of the SQLite reference index used by the 'sqlite' backend."""
+    return os.path.join(assistant_dir, "reference_graph.db")
+
+
+def rebuild_reference_graph(assistant_dir: str, max_workers: int | None = None) -> ReferenceScanResult:
+    """
+    Rebuild the stored reference graph and refresh the cached in-memory graph.
+    
+    With the 'csv' backend, reference_graph.csv, reference_graph.md and the manifest are rewritten.
+    With the 'sqlite' backend, only the changed rows of reference_graph.db are upserted;
+    CSV and Mermaid outputs are written on demand by export_reference_graph.
+    
+    Args:
+        assistant_dir: Path to the .assistant directory.
+        max_workers: Number of threads scanning files, or None for the configured default.
+    
+    Returns:
+        ReferenceScanResult of the rebuild.
+    """
+    with _reference_graph_lock:
+        # Collect all filenames, build edges (reusing unchanged files from the previous build), and store them
+        all_filenames = collect_all_filenames(assistant_dir)
+        max_workers = max_workers or REFERENCE_SCAN_WORKERS
+        
+        if REFERENCE_GRAPH_BACKEND == "sqlite":
+            with closing(_reference_db.connect(_reference_db_path(assistant_dir))) as conn:
+                previous_manifest = _reference_db.load_manifest(conn, MANIFEST_VERSION)
+                scan = build_reference_edges(assistant_dir, all_filenames, previous_manifest, max_workers=max_workers)
+                _reference_db.save_scan(conn, scan.manifest, scan.edges, scan.edge_ranges)
+        else:
+            manifest_path = os.path.join(assistant_dir, "reference_graph_manifest.json")
+            scan = build_reference_edges(
+                assistant_dir, all_filenames, load_reference_manifest(manifest_path), max_workers=max_workers
+            )
+            write_reference_csv(os.path.join(assistant_dir, "reference_graph.csv"), scan.edges)
+            write_reference_mermaid(os.path.join(assistant_dir, "reference_graph.md"), scan.edges, scan.file_to_dir)
+            write_reference_manifest(manifest_path, scan.manifest)
+        
+        _reference_graphs[assistant_dir] = ReferenceGraph.from_edges(
+            scan.edges, scan.file_to_dir, manifest_signature(scan.manifest)
+        )
+        
+        return scan
+
+
+def read_reference_csv(csv_path: str) -> list[tuple[str, str]]:
+    """
+    Read reference edges from a CSV file.
+    
+    Args:
+        csv_path: Path to the CSV file to read.
+    
+    Returns:
+        List of edge tuples (start_point, end_point).
+    """
+    with open(csv_path, 'r', encoding='utf-8') as csvfile:
+        return [(row['start_point'], row['end_point']) for row in csv.DictReader(csvfile)]
+
+
+def load_stored_reference_graph(assistant_dir: str, snapshot: dict[str, tuple[int, int]]) -> ReferenceGraph | None:
+    """
+    Load the reference graph from disk, if what is stored still matches the workspace.
+    
+    Args:
+        assistant_dir: Path to the .assistant directory.
+        snapshot: The current file signature, from snapshot_workspace().
+    
+    Returns:
+        The stored reference graph, or None if it is missing or out of date.
+    """
+    if REFERENCE_GRAPH_BACKEND == "sqlite":
+        with closing(_reference_db.connect(_reference_db_path(assistant_dir))) as conn:
+            if _reference_db.load_signature(conn) != snapshot:
+                return None
+            edges, file_to_dir = _reference_db.load_edges(conn)
+    else:
+        manifest_path = os.path.join(assistant_dir, "reference_graph_manifest.json")
+        csv_path = os.path.join(assistant_dir, "reference_graph.csv")
+        manifest = load_reference_manifest(manifest_path)
+        if not os.path.exists(csv_path) or manifest_signature(manifest) != snapshot:
+            return None
+        edges = read_reference_csv(csv_path)
+        file_to_dir = {entry["filename"]: entry["dir"] for entry in manifest["files"].values()}
+    
+    return ReferenceGraph.from_edges(edges, file_to_dir, snapshot)
+
+
+def is_reference_graph_current(assistant_dir: str, snapshot: dict[str, tuple[int, int]]) -> bool:
+    """
+    Check whether the cached (or else the stored) reference graph matches the workspace.
+    
+    Args:
+        assistant_dir: Path to the .assistant directory.
+        snapshot: The current file signature, from snapshot_workspace().
+    
+    Returns:
+        True if no rebuild is needed.
+    """
+    graph = _reference_graphs.get(assistant_dir)
+    if graph is not None:
+        return graph.signature == snapshot
+    
+    if REFERENCE_GRAPH_BACKEND == "sqlite":
+        with closing(_reference_db.connect(_reference_db_path(assistant_dir))) as conn:
+            return _reference_db.load_signature(conn) == snapshot
+    
+    manifest = load_reference_manifest(os.path.join(assistant_dir, "reference_graph_manifest.json"))
+    return os.path.exists(os.path.join(assistant_dir, "reference_graph.csv")) and manifest_signature(manifest) == snapshot
+
+
+def get_reference_graph(assistant_dir: str, force_rebuild: bool = False) -> tuple[ReferenceGraph, bool]:
+    """
+    Get the in-memory reference graph of a workspace, rebuilding it only if it is stale.
+    
+    Staleness is checked by stat-ing the scanned files (no reads) and comparing the result with the
+    signature of the cached graph, or with the stored manifest / index when nothing is cached yet.
+    
+    Args:
+        assistant_dir: Path to the .assistant directory.
+        force_rebuild: If True, always rebuild the graph.
+    
+    Returns:
+        Tuple of (graph, rebuilt) where rebuilt tells whether the graph had to be rebuilt.
+    """
+    with _reference_graph_lock:
+        if not force_rebuild:
+            snapshot = snapshot_workspace(assistant_dir)
+            
+            graph = _reference_graphs.get(assistant_dir)
+            if graph is not None and graph.signature == snapshot:
+                return graph, False
+            
+            # Nothing (current) in memory: the stored graph is usable if it still matches
+            graph = load_stored_reference_graph(assistant_dir, snapshot)
+            if graph is not None:
+                _reference_graphs[assistant_dir] = graph
+                return graph, False
+        
+        rebuild_reference_graph(assistant_dir)
+        return _reference_graphs[assistant_dir], True
 
 
 @mcp.tool()
-def update_reference_graph(abs_path: str) -> GlyphMCPResponse[None]:
+def update_reference_graph(abs_path: str, max_workers: int | None = None) -> GlyphMCPResponse[None]:
     """
     Scan all design logs, operations, and artifacts for references and update reference_graph.csv.
     
@@ -218,10 +842,15 @@ def update_reference_graph(abs_path: str) -> GlyphMCPResponse[None]:
     2. For each file in these directories, find which other filenames are mentioned in it
     3. Create or update the reference_graph.csv file in the .assistant directory
     
+    Only new or changed files are rescanned; everything else is reused from reference_graph_manifest.json,
+    which records each file's size, mtime, content hash and outgoing references.
+    
     The CSV has two columns: start_point and end_point, representing directed edges in the reference graph.
     
     Args:
         abs_path: The absolute path of the project's root where the .assistant folder is located. Absolute path is required.
+        max_workers: Number of threads reading and scanning files (useful on network drives).
+                     Defaults to the server's configured value; 1 scans serially.
     
     Returns:
         GlyphMCPResponse indicating success or failure with statistics.
@@ -241,23 +870,28 @@ def update_reference_graph(abs_path: str) -> GlyphMCPResponse[None]:
             )
             return response
         
-        # Collect all filenames, build edges, and write both CSV and Mermaid MD
-        all_filenames = collect_all_filenames(assistant_dir)
-        edges, file_to_dir = build_reference_edges(assistant_dir, all_filenames)
+        if max_workers is not None and max_workers < 1:
+            response.add_context(f"max_workers must be >= 1, got {max_workers}")
+            return response
         
-        csv_path = os.path.join(assistant_dir, "reference_graph.csv")
-        md_path = os.path.join(assistant_dir, "reference_graph.md")
-        
-        write_reference_csv(csv_path, edges)
-        write_reference_mermaid(md_path, edges, file_to_dir)
+        scan = rebuild_reference_graph(assistant_dir, max_workers)
+        edges = scan.edges
         
         # Statistics
         unique_sources = len(set(edge[0] for edge in edges))
         total_edges = len(edges)
         
         response.add_context(f"Reference graph updated successfully")
-        response.add_context(f"CSV: {csv_path}")
-        response.add_context(f"Mermaid: {md_path}")
+        if REFERENCE_GRAPH_BACKEND == "sqlite":
+            response.add_context(f"SQLite index: {_reference_db_path(assistant_dir)}")
+            response.add_context("Use export_reference_graph to write the CSV and Mermaid files")
+        else:
+            response.add_context(f"CSV: {os.path.join(assistant_dir, 'reference_graph.csv')}")
+            response.add_context(f"Mermaid: {os.path.join(assistant_dir, 'reference_graph.md')}")
+        response.add_context(
+            f"Scanned {scan.scanned_count} new or changed files, re-checked {scan.rechecked_count} "
+            f"unchanged files against new targets ({scan.file_count} files total)"
+        )
         response.add_context(f"Statistics: {unique_sources} files with references, {total_edges} reference edges")
         response.success = True
         
@@ -267,56 +901,174 @@ def update_reference_graph(abs_path: str) -> GlyphMCPResponse[None]:
     return response
 
 
-def _query_reference_graph(abs_path: str, file_name: str, match_column: str, return_column: str, context_msg: str) -> GlyphMCPResponse[list[str]]:
+@mcp.tool()
+def export_reference_graph(abs_path: str) -> GlyphMCPResponse[None]:
     """
-    Helper function to query the reference graph CSV.
+    Write reference_graph.csv and reference_graph.md from the current reference graph.
+    
+    With the default 'csv' backend these files are already rewritten by every rebuild.
+    With the 'sqlite' backend they are only produced on demand by this tool, for compatibility.
     
     Args:
-        abs_path: The absolute path of the project's root where the .assistant folder is located.
-        file_name: The name of the file to search for.
-        match_column: The column name to match against (e.g., 'start_point' or 'end_point').
-        return_column: The column name to return values from.
-        context_msg: The success message template (should contain {count} and {file_name}).
+        abs_path: The absolute path of the project's root where the .assistant folder is located. Absolute path is required.
     
     Returns:
-        GlyphMCPResponse containing a list of matching filenames.
+        GlyphMCPResponse indicating success or failure with the written paths.
     """
-    response = GlyphMCPResponse[list[str]]()
+    response = GlyphMCPResponse[None]()
     
     try:
-        # First update the reference graph to ensure it's current
-        update_response = update_reference_graph(abs_path)
-        if not update_response.success:
-            response.add_context("Failed to update reference graph")
-            response.add_context(update_response.context)
+        assistant_dir = _resolve_assistant_dir(abs_path, response)
+        if assistant_dir is None:
             return response
         
-        assistant_dir = os.path.join(abs_path, BASE_NAME)
+        _, rebuilt = get_reference_graph(assistant_dir)
+        if rebuilt:
+            response.add_context("Reference graph was out of date and has been rebuilt")
+        
         csv_path = os.path.join(assistant_dir, "reference_graph.csv")
+        md_path = os.path.join(assistant_dir, "reference_graph.md")
         
-        if not os.path.exists(csv_path):
-            response.add_context(f"Reference graph CSV not found at {csv_path}")
-            return response
+        if REFERENCE_GRAPH_BACKEND == "sqlite":
+            with closing(_reference_db.connect(_reference_db_path(assistant_dir))) as conn:
+                edges, file_to_dir = _reference_db.load_edges(conn)
+            write_reference_csv(csv_path, edges)
+        else:
+            manifest = load_reference_manifest(os.path.join(assistant_dir, "reference_graph_manifest.json"))
+            edges = read_reference_csv(csv_path)
+            file_to_dir = {entry["filename"]: entry["dir"] for entry in manifest["files"].values()}
         
-        matching_files = []
-        file_exists_in_graph = False
+        write_reference_mermaid(md_path, edges, file_to_dir)
         
-        with open(csv_path, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                # Check if file exists anywhere in the graph
-                if row['start_point'] == file_name or row['end_point'] == file_name:
-                    file_exists_in_graph = True
-                
-                # Check for matching references
-                if row[match_column] == file_name:
-                    matching_files.append(row[return_column])
-        
-        # If file doesn't exist in the graph at all, fail with explanation
-        if not file_exists_in_graph:
-            response.add_context(f"File '{file_name}' does not exist in the project")
-            response.add_context("The file was not found in design_logs, operations, or artifacts directories")
-            return response
+        response.add_context(f"CSV: {csv_path}")
+        response.add_context(f"Mermaid: {md_path}")
+        response.add_context(f"Exported {len(edges)} reference edges")
+        response.success = True
+        
+    except Exception as e:
+        response.add_context(f"Failed to export reference graph: {str(e)}")
+    
+    return response
+
+
+def _resolve_assistant_dir(abs_path: str, response: GlyphMCPResponse) -> str | None:
+    """
+    Helper function to validate a query's project path.
+    
+    Args:
+        abs_path: The absolute path of the project's root where the .assistant folder is located.
+        response: Response object to add context messages to.
+    
+    Returns:
+        Path to the .assistant directory, or None if it is invalid or missing.
+    """
+    if not validate_absolute_path(abs_path, response):
+        return None
+    
+    assistant_dir = os.path.join(abs_path, BASE_NAME)
+    
+    if not os.path.exists(assistant_dir):
+        response.add_context("Failed to update reference graph")
+        response.add_context(
+            f"Assistant directory not found at {assistant_dir}. "
+            "Please initialize the assistant directory first."
+        )
+        return None
+    
+    return assistant_dir
+
+
+def _add_file_not_found_context(response: GlyphMCPResponse, file_name: str) -> None:
+    """Explain that a queried file does not exist in the reference graph."""
+    response.add_context(f"File '{file_name}' does not exist in the project")
+    response.add_context("The file was not found in design_logs, operations, or artifacts directories")
+
+
+def _load_graph_for_query(abs_path: str, file_names: list[str], response: GlyphMCPResponse, force_rebuild: bool = False) -> ReferenceGraph | None:
+    """
+    Helper function to get a project's reference graph and check the queried files exist in it.
+    
+    Args:
+        abs_path: The absolute path of the project's root where the .assistant folder is located.
+        file_names: The names of the files the query is about.
+        response: Response object to add context messages to.
+        force_rebuild: If True, rebuild the reference graph even if it is up to date.
+    
+    Returns:
+        The reference graph, or None if the query cannot be answered.
+    """
+    assistant_dir = _resolve_assistant_dir(abs_path, response)
+    if assistant_dir is None:
+        return None
+    
+    graph, rebuilt = get_reference_graph(assistant_dir, force_rebuild)
+    if rebuilt:
+        response.add_context("Reference graph was out of date and has been rebuilt")
+    
+    # If a file doesn't exist in the graph at all, fail with explanation
+    for file_name in file_names:
+        if file_name not in graph:
+            _add_file_not_found_context(response, file_name)
+            return None
+    
+    return graph
+
+
+def _query_reference_db(abs_path: str, file_name: str, reverse: bool, response: GlyphMCPResponse, force_rebuild: bool = False) -> list[str] | None:
+    """
+    Helper function to answer a direct references query with an indexed lookup in reference_graph.db.
+    
+    Args:
+        abs_path: The absolute path of the project's root where the .assistant folder is located.
+        file_name: The name of the file to search for.
+        reverse: If False, return the files file_name references; if True, the files referencing it.
+        response: Response object to add context messages to.
+        force_rebuild: If True, rebuild the reference graph even if it is up to date.
+    
+    Returns:
+        The matching filenames, or None if the query cannot be answered.
+    """
+    assistant_dir = _resolve_assistant_dir(abs_path, response)
+    if assistant_dir is None:
+        return None
+    
+    if force_rebuild or not is_reference_graph_current(assistant_dir, snapshot_workspace(assistant_dir)):
+        rebuild_reference_graph(assistant_dir)
+        response.add_context("Reference graph was out of date and has been rebuilt")
+    
+    with closing(_reference_db.connect(_reference_db_path(assistant_dir))) as conn:
+        if not _reference_db.contains(conn, file_name):
+            _add_file_not_found_context(response, file_name)
+            return None
+        return _reference_db.query_references(conn, file_name, reverse)
+
+
+def _query_reference_graph(abs_path: str, file_name: str, reverse: bool, context_msg: str, force_rebuild: bool = False) -> GlyphMCPResponse[list[str]]:
+    """
+    Helper function to query the cached reference graph (or the SQLite index with the 'sqlite' backend).
+    
+    Args:
+        abs_path: The absolute path of the project's root where the .assistant folder is located.
+        file_name: The name of the file to search for.
+        reverse: If False, return the files file_name references; if True, the files referencing it.
+        context_msg: The success message template (should contain {count} and {file_name}).
+        force_rebuild: If True, rebuild the reference graph even if it is up to date.
+    
+    Returns:
+        GlyphMCPResponse containing a list of matching filenames.
+    """
+    response = GlyphMCPResponse[list[str]]()
+    
+    try:
+        if REFERENCE_GRAPH_BACKEND == "sqlite":
+            matching_files = _query_reference_db(abs_path, file_name, reverse, response, force_rebuild)
+            if matching_files is None:
+                return response
+        else:
+            graph = _load_graph_for_query(abs_path, [file_name], response, force_rebuild)
+            if graph is None:
+                return response
+            matching_files = graph.references_to(file_name) if reverse else graph.references_from(file_name)
         
         response.success = True
         response.result = matching_files
@@ -328,19 +1080,73 @@ def _query_reference_graph(abs_path: str, file_name: str, match_column: str, ret
     return response
 
 
+def _traverse_reference_graph(
+    abs_path: str,
+    file_name: str,
+    direction: Literal["from", "to"],
+    max_depth: int | None
+) -> GlyphMCPResponse[list[dict[str, Any]]]:
+    """
+    Helper function to run a breadth-first traversal over the cached reference graph.
+    
+    Args:
+        abs_path: The absolute path of the project's root where the .assistant folder is located.
+        file_name: The name of the file to start from.
+        direction: "from" to follow references made by files, "to" to follow references made to them.
+        max_depth: Maximum number of hops, or None for no limit.
+    
+    Returns:
+        GlyphMCPResponse containing the reached files with their hop distance.
+    """
+    response = GlyphMCPResponse[list[dict[str, Any]]]()
+    
+    if direction not in ("from", "to"):
+        response.add_context(f"Invalid direction: {direction}. Must be one of: from, to")
+        return response
+    
+    if max_depth is not None and max_depth < 1:
+        response.add_context(f"max_depth must be >= 1, got {max_depth}")
+        return response
+    
+    try:
+        graph = _load_graph_for_query(abs_path, [file_name], response)
+        if graph is None:
+            return response
+        
+        distances = graph.traverse(file_name, reverse=(direction == "to"), max_depth=max_depth)
+        
+        response.success = True
+        response.result = [
+            {"file": name, "distance": distance, "dir_type": graph.dir_type(name)}
+            for name, distance in distances.items()
+        ]
+        
+        max_distance = max(distances.values(), default=0)
+        relation = "referenced by" if direction == "from" else "referencing"
+        response.add_context(
+            f"Reached {len(distances)} files {relation} {file_name} (transitively), up to {max_distance} hop(s) away"
+        )
+        
+    except Exception as e:
+        response.add_context(f"Failed to traverse reference graph from {file_name}: {str(e)}")
+    
+    return response
+
+
 @mcp.tool()
-def get_references_from(abs_path: str, file_name: str) -> GlyphMCPResponse[list[str]]:
+def get_references_from(abs_path: str, file_name: str, force_rebuild: bool = False) -> GlyphMCPResponse[list[str]]:
     """
     Get all files that are referenced by the specified file.
     
     This tool will:
-    1. Update the reference graph to ensure it's current
-    2. Read the reference_graph.csv file
+    1. Check whether any file changed since the reference graph was last built, rebuilding it only if so
+    2. Look the file up in the cached in-memory reference graph
     3. Return all files that the specified file references
     
     Args:
         abs_path: The absolute path of the project's root where the .assistant folder is located. Absolute path is required.
         file_name: The name of the file to find references from.
+        force_rebuild: If True, rebuild the reference graph even if no file changed.
     
     Returns:
         GlyphMCPResponse containing a list of filenames that are referenced by the specified file.
@@ -348,25 +1154,26 @@ def get_references_from(abs_path: str, file_name: str) -> GlyphMCPResponse[list[
     return _query_reference_graph(
         abs_path, 
         file_name, 
-        match_column='start_point',
-        return_column='end_point',
-        context_msg="Found {count} files referenced by {file_name}"
+        reverse=False,
+        context_msg="Found {count} files referenced by {file_name}",
+        force_rebuild=force_rebuild
     )
 
 
 @mcp.tool()
-def find_references_to(abs_path: str, file_name: str) -> GlyphMCPResponse[list[str]]:
+def find_references_to(abs_path: str, file_name: str, force_rebuild: bool = False) -> GlyphMCPResponse[list[str]]:
     """
     Find all files that reference the specified file.
     
     This tool will:
-    1. Update the reference graph to ensure it's current
-    2. Read the reference_graph.csv file
+    1. Check whether any file changed since the reference graph was last built, rebuilding it only if so
+    2. Look the file up in the cached in-memory reference graph
     3. Return all files that reference the specified file
     
     Args:
         abs_path: The absolute path of the project's root where the .assistant folder is located. Absolute path is required.
         file_name: The name of the file to find references to.
+        force_rebuild: If True, rebuild the reference graph even if no file changed.
     
     Returns:
         GlyphMCPResponse containing a list of filenames that reference the specified file.
@@ -374,7 +1181,82 @@ def find_references_to(abs_path: str, file_name: str) -> GlyphMCPResponse[list[s
     return _query_reference_graph(
         abs_path, 
         file_name, 
-        match_column='end_point',
-        return_column='start_point',
-        context_msg="Found {count} files that reference {file_name}"
+        reverse=True,
+        context_msg="Found {count} files that reference {file_name}",
+        force_rebuild=force_rebuild
     )
+
+
+@mcp.tool()
+def get_transitive_references(abs_path: str, file_name: str, direction: Literal["from", "to"] = "from") -> GlyphMCPResponse[list[dict[str, Any]]]:
+    """
+    Get every file reachable from the specified file through chains of references (transitive closure).
+    
+    Use this instead of calling get_references_from / find_references_to repeatedly to walk the graph.
+    
+    Args:
+        abs_path: The absolute path of the project's root where the .assistant folder is located. Absolute path is required.
+        file_name: The name of the file to start from.
+        direction: "from" to follow what the file references (and what those reference, ...),
+                   "to" to follow what references the file (and what references those, ...).
+    
+    Returns:
+        GlyphMCPResponse containing the reached files as {"file", "distance", "dir_type"} entries, nearest first.
+    """
+    return _traverse_reference_graph(abs_path, file_name, direction, max_depth=None)
+
+
+@mcp.tool()
+def traverse_references(abs_path: str, file_name: str, max_depth: int, direction: Literal["from", "to"] = "from") -> GlyphMCPResponse[list[dict[str, Any]]]:
+    """
+    Get the files within a limited number of reference hops from the specified file (depth-limited BFS).
+    
+    Args:
+        abs_path: The absolute path of the project's root where the .assistant folder is located. Absolute path is required.
+        file_name: The name of the file to start from.
+        max_depth: Maximum number of hops to follow (1 is equivalent to a direct references query).
+        direction: "from" to follow what the file references, "to" to follow what references the file.
+    
+    Returns:
+        GlyphMCPResponse containing the reached files as {"file", "distance", "dir_type"} entries, nearest first.
+    """
+    return _traverse_reference_graph(abs_path, file_name, direction, max_depth=max_depth)
+
+
+@mcp.tool()
+def find_reference_path(abs_path: str, source_file: str, target_file: str) -> GlyphMCPResponse[list[dict[str, Any]]]:
+    """
+    Find the shortest chain of references leading from one file to another.
+    
+    Args:
+        abs_path: The absolute path of the project's root where the .assistant folder is located. Absolute path is required.
+        source_file: The name of the file the chain starts at.
+        target_file: The name of the file the chain should reach.
+    
+    Returns:
+        GlyphMCPResponse containing the files on the path as {"file", "distance", "dir_type"} entries,
+        from source_file (distance 0) to target_file.
+    """
+    response = GlyphMCPResponse[list[dict[str, Any]]]()
+    
+    try:
+        graph = _load_graph_for_query(abs_path, [source_file, target_file], response)
+        if graph is None:
+            return response
+        
+        path = graph.shortest_path(source_file, target_file)
+        if path is None:
+            response.add_context(f"No chain of references leads from {source_file} to {target_file}")
+            return response
+        
+        response.success = True
+        response.result = [
+            {"file": name, "distance": distance, "dir_type": graph.dir_type(name)}
+            for distance, name in enumerate(path)
+        ]
+        response.add_context(f"Found a path of {len(path) - 1} hop(s) from {source_file} to {target_file}")
+        
+    except Exception as e:
+        response.add_context(f"Failed to find a reference path from {source_file} to {target_file}: {str(e)}")
+    
+    return response
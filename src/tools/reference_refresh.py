@@ -0,0 +1,148 @@
+"""
+Coalesced background refreshes of the reference graph.
+
+Tools that change the workspace can schedule a refresh instead of rebuilding the graph
+synchronously. At most one refresh runs per project; requests arriving while it runs are
+merged into a single follow-up refresh, so a burst of calls costs at most two rebuilds.
+"""
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+from mcp_object import mcp
+from config import BASE_NAME
+from response import GlyphMCPResponse
+from ._utils import validate_absolute_path
+from .reference_graph import rebuild_reference_graph
+
+
+@dataclass
+class ReferenceRefreshState:
+    """Background refresh bookkeeping of one .assistant directory."""
+    running: bool = False
+    pending: bool = False
+    requested: int = 0
+    completed: int = 0
+    last_completed: float | None = None
+    last_duration: float | None = None
+    last_error: str | None = None
+    
+    def to_dict(self) -> dict[str, Any]:
+        """Describe the state for clients."""
+        if self.running:
+            state = "running, another refresh queued" if self.pending else "running"
+        else:
+            state = "idle"
+        
+        return {
+            "state": state,
+            "requested": self.requested,
+            "completed": self.completed,
+            "coalesced": max(self.requested - self.completed - int(self.running) - int(self.pending), 0),
+            "last_completed": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.last_completed)) if self.last_completed else None,
+            "last_duration_seconds": round(self.last_duration, 3) if self.last_duration is not None else None,
+            "last_error": self.last_error
+        }
+
+
+_refresh_states: dict[str, ReferenceRefreshState] = {}
+_refresh_lock = threading.Lock()
+
+
+def _run_refreshes(assistant_dir: str, state: ReferenceRefreshState) -> None:
+    """Rebuild until no refresh is pending anymore."""
+    while True:
+        start = time.perf_counter()
+        try:
+            rebuild_reference_graph(assistant_dir)
+            error = None
+        except Exception as e:
+            error = str(e)
+        
+        with _refresh_lock:
+            state.completed += 1
+            state.last_completed = time.time()
+            state.last_duration = time.perf_counter() - start
+            state.last_error = error
+            
+            if not state.pending:
+                state.running = False
+                return
+            state.pending = False
+
+
+def schedule_reference_graph_refresh(assistant_dir: str) -> bool:
+    """
+    Schedule a background rebuild of the reference graph, coalescing it with any queued one.
+    
+    Args:
+        assistant_dir: Path to the .assistant directory.
+    
+    Returns:
+        True if a refresh was started, False if the request was merged into a running or queued one.
+    """
+    with _refresh_lock:
+        state = _refresh_states.setdefault(assistant_dir, ReferenceRefreshState())
+        state.requested += 1
+        
+        if state.running:
+            state.pending = True
+            return False
+        
+        state.running = True
+    
+    threading.Thread(
+        target=_run_refreshes, args=(assistant_dir, state), name=f"reference-refresh:{assistant_dir}", daemon=True
+    ).start()
+    return True
+
+
+def get_reference_refresh_state(assistant_dir: str) -> dict[str, Any]:
+    """
+    Get the background refresh state of an .assistant directory.
+    
+    Args:
+        assistant_dir: Path to the .assistant directory.
+    
+    Returns:
+        Dict describing the state (see ReferenceRefreshState.to_dict).
+    """
+    with _refresh_lock:
+        return _refresh_states.get(assistant_dir, ReferenceRefreshState()).to_dict()
+
+
+@mcp.tool()
+def get_reference_graph_status(abs_path: str) -> GlyphMCPResponse[dict[str, Any]]:
+    """
+    Report whether a background reference graph refresh is running, and how the last one went.
+    
+    Poll this after calling a tool with refresh_in_background=True (e.g. persist_artifacts) to know
+    when the reference graph is up to date again.
+    
+    Args:
+        abs_path: The absolute path of the project's root where the .assistant folder is located. Absolute path is required.
+    
+    Returns:
+        GlyphMCPResponse containing the refresh state ('idle', 'running' or 'running, another refresh queued'),
+        request / completion counters, and the time, duration and error of the last refresh.
+    """
+    response = GlyphMCPResponse[dict[str, Any]]()
+    
+    if not validate_absolute_path(abs_path, response):
+        return response
+    
+    try:
+        assistant_dir = os.path.join(abs_path, BASE_NAME)
+        status = get_reference_refresh_state(assistant_dir)
+        
+        response.result = status
+        response.add_context(f"Reference graph refresh is {status['state']}")
+        if status["last_error"]:
+            response.add_context(f"Last refresh failed: {status['last_error']}")
+        response.success = True
+        
+    except Exception as e:
+        response.add_context(f"Failed to get reference graph status: {str(e)}")
+    
+    return response
@@ -0,0 +1,255 @@
+"""
+Background watcher that keeps a project's reference graph live.
+
+The watcher polls the scanned directories with stat calls only (no reads) and rebuilds the
+reference graph incrementally once the workspace has been quiet for the debounce interval.
+That way edits made outside the MCP tools (e.g. by hand in an editor) are picked up before
+the next query, and queries find the cached graph already current.
+"""
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+from mcp_object import mcp
+from config import BASE_NAME, REFERENCE_WATCH_DEBOUNCE, REFERENCE_WATCH_POLL_INTERVAL
+from response import GlyphMCPResponse
+from ._utils import validate_absolute_path
+from .reference_graph import is_reference_graph_current, rebuild_reference_graph, snapshot_workspace
+
+
+@dataclass
+class WatcherStatus:
+    """Snapshot of a watcher's state, as reported to clients."""
+    assistant_dir: str
+    poll_interval: float
+    debounce: float
+    rebuild_count: int
+    last_rebuild: str | None
+    last_error: str | None
+
+
+class ReferenceGraphWatcher:
+    """Polls an .assistant directory and rebuilds its reference graph after changes settle."""
+    
+    def __init__(self, assistant_dir: str, poll_interval: float, debounce: float):
+        """
+        Create a watcher (not started yet).
+        
+        Args:
+            assistant_dir: Path to the .assistant directory.
+            poll_interval: Seconds between two workspace snapshots.
+            debounce: Seconds the workspace must stay unchanged before rebuilding.
+        """
+        self.assistant_dir = assistant_dir
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.rebuild_count = 0
+        self.last_rebuild: float | None = None
+        self.last_error: str | None = None
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name=f"reference-watcher:{assistant_dir}", daemon=True
+        )
+    
+    def start(self) -> None:
+        """Start polling in a daemon thread."""
+        self._thread.start()
+    
+    def stop(self, timeout: float | None = None) -> None:
+        """
+        Stop polling and wait for the thread to exit.
+        
+        Args:
+            timeout: Maximum seconds to wait for the thread, or None to wait indefinitely.
+        """
+        self._stop_event.set()
+        self._thread.join(timeout)
+    
+    def is_alive(self) -> bool:
+        return self._thread.is_alive()
+    
+    def status(self) -> WatcherStatus:
+        """Report the watcher's configuration and rebuild history."""
+        return WatcherStatus(
+            assistant_dir=self.assistant_dir,
+            poll_interval=self.poll_interval,
+            debounce=self.debounce,
+            rebuild_count=self.rebuild_count,
+            last_rebuild=time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.last_rebuild)) if self.last_rebuild else None,
+            last_error=self.last_error
+        )
+    
+    def _rebuild_if_stale(self, snapshot: dict[str, tuple[int, int]]) -> None:
+        """Rebuild the reference graph unless it already matches the snapshot."""
+        try:
+            if not is_reference_graph_current(self.assistant_dir, snapshot):
+                rebuild_reference_graph(self.assistant_dir)
+                self.rebuild_count += 1
+                self.last_rebuild = time.time()
+            self.last_error = None
+        except Exception as e:
+            self.last_error = str(e)
+    
+    def _run(self) -> None:
+        """Poll loop: restart the debounce timer on every change, rebuild once changes settle."""
+        last_seen = snapshot_workspace(self.assistant_dir)
+        self._rebuild_if_stale(last_seen)
+        changed_at: float | None = None
+        
+        while not self._stop_event.wait(self.poll_interval):
+            snapshot = snapshot_workspace(self.assistant_dir)
+            
+            if snapshot != last_seen:
+                last_seen = snapshot
+                changed_at = time.monotonic()
+                continue
+            
+            if changed_at is not None and time.monotonic() - changed_at >= self.debounce:
+                changed_at = None
+                self._rebuild_if_stale(snapshot)
+
+
+# Running watchers, keyed by .assistant directory
+_watchers: dict[str, ReferenceGraphWatcher] = {}
+_watchers_lock = threading.Lock()
+
+
+def start_reference_watcher(
+    assistant_dir: str,
+    poll_interval: float = REFERENCE_WATCH_POLL_INTERVAL,
+    debounce: float = REFERENCE_WATCH_DEBOUNCE
+) -> tuple[ReferenceGraphWatcher, bool]:
+    """
+    Start watching an .assistant directory, unless a watcher is already running for it.
+    
+    Args:
+        assistant_dir: Path to the .assistant directory.
+        poll_interval: Seconds between two workspace snapshots.
+        debounce: Seconds the workspace must stay unchanged before rebuilding.
+    
+    Returns:
+        Tuple of (watcher, started) where started is False if a watcher was already running.
+    
+    Raises:
+        ValueError: If poll_interval is not positive or debounce is negative (the watcher would busy-poll).
+    """
+    if poll_interval <= 0 or debounce < 0:
+        raise ValueError(f"poll_interval must be > 0 and debounce >= 0, got {poll_interval} and {debounce}")
+    
+    with _watchers_lock:
+        watcher = _watchers.get(assistant_dir)
+        if watcher is not None and watcher.is_alive():
+            return watcher, False
+        
+        watcher = ReferenceGraphWatcher(assistant_dir, poll_interval, debounce)
+        watcher.start()
+        _watchers[assistant_dir] = watcher
+        return watcher, True
+
+
+def stop_reference_watcher(assistant_dir: str) -> ReferenceGraphWatcher | None:
+    """
+    Stop the watcher of an .assistant directory.
+    
+    Args:
+        assistant_dir: Path to the .assistant directory.
+    
+    Returns:
+        The stopped watcher, or None if none was running.
+    """
+    with _watchers_lock:
+        watcher = _watchers.pop(assistant_dir, None)
+    
+    if watcher is not None:
+        watcher.stop(timeout=max(watcher.poll_interval * 2, 5.0))
+    return watcher
+
+
+@mcp.tool()
+def watch_reference_graph(
+    abs_path: str,
+    poll_interval: float = REFERENCE_WATCH_POLL_INTERVAL,
+    debounce: float = REFERENCE_WATCH_DEBOUNCE
+) -> GlyphMCPResponse[dict[str, Any]]:
+    """
+    Keep a project's reference graph up to date in the background.
+    
+    A watcher polls design_logs, operations and artifacts (stat only) and, once changes have
+    settled for `debounce` seconds, incrementally rebuilds the in-memory graph and the stored
+    reference graph. Edits made outside the MCP tools are then picked up without a query paying
+    for the rebuild. The watcher runs until unwatch_reference_graph is called or the server exits.
+    
+    Args:
+        abs_path: The absolute path of the project's root where the .assistant folder is located. Absolute path is required.
+        poll_interval: Seconds between two polls of the workspace.
+        debounce: Seconds the workspace must stay unchanged before the graph is rebuilt.
+    
+    Returns:
+        GlyphMCPResponse containing the watcher's status.
+    """
+    response = GlyphMCPResponse[dict[str, Any]]()
+    
+    if not validate_absolute_path(abs_path, response):
+        return response
+    
+    try:
+        assistant_dir = os.path.join(abs_path, BASE_NAME)
+        
+        if not os.path.exists(assistant_dir):
+            response.add_context(
+                f"Assistant directory not found at {assistant_dir}. "
+                "Please initialize the assistant directory first."
+            )
+            return response
+        
+        if poll_interval <= 0 or debounce < 0:
+            response.add_context(f"poll_interval must be > 0 and debounce >= 0, got {poll_interval} and {debounce}")
+            return response
+        
+        watcher, started = start_reference_watcher(assistant_dir, poll_interval, debounce)
+        
+        if started:
+            response.add_context(f"Watching {assistant_dir} for reference changes")
+        else:
+            response.add_context(f"A watcher is already running for {assistant_dir}")
+        response.result = vars(watcher.status())
+        response.success = True
+        
+    except Exception as e:
+        response.add_context(f"Failed to start reference graph watcher: {str(e)}")
+    
+    return response
+
+
+@mcp.tool()
+def unwatch_reference_graph(abs_path: str) -> GlyphMCPResponse[None]:
+    """
+    Stop the background watcher started by watch_reference_graph.
+    
+    Args:
+        abs_path: The absolute path of the project's root where the .assistant folder is located. Absolute path is required.
+    
+    Returns:
+        GlyphMCPResponse indicating success or failure.
+    """
+    response = GlyphMCPResponse[None]()
+    
+    if not validate_absolute_path(abs_path, response):
+        return response
+    
+    try:
+        assistant_dir = os.path.join(abs_path, BASE_NAME)
+        watcher = stop_reference_watcher(assistant_dir)
+        
+        if watcher is None:
+            response.add_context(f"No watcher is running for {assistant_dir}")
+            return response
+        
+        response.add_context(f"Stopped watching {assistant_dir} ({watcher.rebuild_count} background rebuilds)")
+        response.success = True
+        
+    except Exception as e:
+        response.add_context(f"Failed to stop reference graph watcher: {str(e)}")
+    
+    return response
@@ -2,17 +2,21 @@
 Static code analysis tool for analyzing source code files.
 Supports multiple languages through pluggable parsers.
 """
+import multiprocessing
 import os
 import statistics
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Dict, List, Any, Optional
 
 from mcp_object import mcp
+from config import BASE_NAME, CODE_ANALYSIS_WORKERS
 from response import GlyphMCPResponse
 from tools._utils import validate_absolute_path
+from tools.metrics_cache import MetricsCache
 from tools.parsers.base_parser import BaseParser
 from tools.parsers.python_parser import PythonParser
 from tools.parsers.csharp_parser import CSharpParser
-from tools.parsers.shared_models import FileMetrics
 
 
 # Registry of available parsers
@@ -39,6 +43,70 @@ def get_supported_extensions() -> List[str]:
     return list(EXTENSION_MAP.keys())
 
 
+def analyze_file(file_path: str) -> Dict[str, Any]:
+    """
+    Parse a supported source file into its metrics.
+    
+    Defined at module level so worker processes can run it; the compact dict form is what
+    crosses the process boundary.
+    
+    Args:
+        file_path: Absolute path to a file with a supported extension.
+    
+    Returns:
+        The file's FileMetrics as a dict.
+    """
+    return get_parser_for_file(file_path).parse_file(file_path).to_dict()
+
+
+def analyze_files(file_paths: List[str], max_workers: int = 1) -> List[Dict[str, Any]]:
+    """
+    Parse supported source files, in worker processes if max_workers > 1.
+    
+    Workers are spawned rather than forked, since the server process runs background threads.
+    
+    Args:
+        file_paths: Absolute paths to files with supported extensions.
+        max_workers: Number of worker processes. 1 parses in the calling process.
+    
+    Returns:
+        The files' metrics as dicts, in the order of file_paths.
+    """
+    if max_workers <= 1 or len(file_paths) <= 1:
+        return [analyze_file(file_path) for file_path in file_paths]
+    
+    max_workers = min(max_workers, len(file_paths))
+    # A few chunks per worker: amortizes inter-process calls while keeping the load balanced
+    chunksize = max(1, len(file_paths) // (max_workers * 4))
+    
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        return list(executor.map(analyze_file, file_paths, chunksize=chunksize))
+
+
+def find_assistant_dir(file_path: str) -> Optional[str]:
+    """
+    Find the .assistant directory of the project a file belongs to.
+    
+    Args:
+        file_path: Absolute path to a file.
+    
+    Returns:
+        Path to the nearest .assistant directory in the file's parent directories, or None.
+    """
+    current_dir = os.path.dirname(os.path.abspath(file_path))
+    
+    while current_dir:
+        potential_assistant = os.path.join(current_dir, BASE_NAME)
+        if os.path.isdir(potential_assistant):
+            return potential_assistant
+        parent = os.path.dirname(current_dir)
+        if parent == current_dir:  # reached root
+            break
+        current_dir = parent
+    
+    return None
+
+
 def get_minimal_unique_paths(file_paths: List[str]) -> Dict[str, str]:
     """
     Generate minimal unique paths for a list of file paths.
@@ -364,7 +432,9 @@ def format_analysis_markdown(all_metrics: List[Dict[str, Any]]) -> str:
 @mcp.tool()
 def static_code_analysis(
     file_paths: List[str],
-    save_to_ad_hoc: bool = False
+    save_to_ad_hoc: bool = False,
+    max_workers: Optional[int] = None,
+    use_cache: bool = True
 ) -> GlyphMCPResponse[Dict[str, Any]]:
     """
     Perform static code analysis on source code files.
@@ -383,6 +453,10 @@ def static_code_analysis(
                    Supported extensions: .py (Python), .cs (C#)
         save_to_ad_hoc: If True, saves the analysis as a markdown file to .assistant/ad_hoc directory.
                        If False, returns the analysis as structured data.
+        max_workers: Number of worker processes parsing files in parallel. Defaults to the server's
+                     configured value; 1 parses in the server process.
+        use_cache: If True, reuses the metrics of files whose content was already analyzed, from the
+                   cache in .assistant/cache (found from the first file's directory).
     
     Returns:
         GlyphMCPResponse containing the analysis results.
@@ -400,52 +474,77 @@ def static_code_analysis(
         if not validate_absolute_path(path, response):
             return response
     
+    if max_workers is not None and max_workers < 1:
+        response.add_context(f"max_workers must be >= 1, got {max_workers}")
+        return response
+    max_workers = max_workers or CODE_ANALYSIS_WORKERS
+    
     supported_extensions = get_supported_extensions()
     response.add_context(f"Supported file types: {', '.join(supported_extensions)}")
     
-    # Analyze each file
-    all_metrics: List[FileMetrics] = []
-    for file_path in file_paths:
+    # Select the files to analyze, keeping a note for each skipped one
+    skip_notes: Dict[int, str] = {}
+    analyzable_paths: List[str] = []
+    for index, file_path in enumerate(file_paths):
         if not os.path.exists(file_path):
-            response.add_context(f"File not found: {file_path}")
-            continue
-        
-        parser = get_parser_for_file(file_path)
-        if parser is None:
-            response.add_context(f"Skipping unsupported file type: {file_path}")
-            continue
-        
-        metrics = parser.parse_file(file_path)
-        all_metrics.append(metrics)
-        response.add_context(f"Analyzed ({parser.language_name}): {file_path}")
+            skip_notes[index] = f"File not found: {file_path}"
+        elif get_parser_for_file(file_path) is None:
+            skip_notes[index] = f"Skipping unsupported file type: {file_path}"
+        else:
+            analyzable_paths.append(file_path)
     
-    if not all_metrics:
+    # Take the metrics of unchanged files from the cache
+    metrics_cache = None
+    if use_cache and analyzable_paths:
+        assistant_dir = find_assistant_dir(file_paths[0])
+        if assistant_dir:
+            metrics_cache = MetricsCache(assistant_dir)
+        else:
+            response.add_context("No .assistant directory found in parent directories, metrics cache not used")
+    
+    metrics_dicts: List[Optional[Dict[str, Any]]] = [None] * len(analyzable_paths)
+    cache_entries: Dict[int, str] = {}
+    if metrics_cache is not None:
+        for index, file_path in enumerate(analyzable_paths):
+            metrics_dicts[index], entry_path = metrics_cache.lookup(file_path, get_parser_for_file(file_path))
+            if metrics_dicts[index] is None and entry_path is not None:
+                cache_entries[index] = entry_path
+    
+    # Analyze the other files (the metrics come back in input order)
+    pending = [index for index, metrics in enumerate(metrics_dicts) if metrics is None]
+    pending_paths = [analyzable_paths[index] for index in pending]
+    try:
+        parsed = analyze_files(pending_paths, max_workers)
+    except (BrokenProcessPool, OSError) as e:
+        response.add_context(f"Worker processes failed ({str(e)}), analyzing in the server process")
+        parsed = analyze_files(pending_paths)
+    
+    for index, metrics in zip(pending, parsed):
+        metrics_dicts[index] = metrics
+        if index in cache_entries:
+            metrics_cache.store(cache_entries[index], metrics)
+    
+    analyzed = iter(metrics_dicts)
+    for index, file_path in enumerate(file_paths):
+        if index in skip_notes:
+            response.add_context(skip_notes[index])
+        else:
+            response.add_context(f"Analyzed ({next(analyzed)['language']}): {file_path}")
+    
+    if metrics_cache is not None:
+        response.add_context(metrics_cache.describe())
+    
+    if not metrics_dicts:
         response.add_context("No supported files were successfully analyzed.")
         return response
     
-    # Convert to dict for output
-    metrics_dicts = [m.to_dict() for m in all_metrics]
-    
     if save_to_ad_hoc:
         # Generate markdown and save to .assistant/ad_hoc directory
         markdown_content = format_analysis_markdown(metrics_dicts)
         
         try:
             # Find .assistant directory by looking up from the first file's directory
-            first_file = file_paths[0]
-            current_dir = os.path.dirname(os.path.abspath(first_file))
-            
-            # Search for .assistant directory
-            assistant_dir = None
-            while current_dir:
-                potential_assistant = os.path.join(current_dir, '.assistant')
-                if os.path.isdir(potential_assistant):
-                    assistant_dir = potential_assistant
-                    break
-                parent = os.path.dirname(current_dir)
-                if parent == current_dir:  # reached root
-                    break
-                current_dir = parent
+            assistant_dir = find_assistant_dir(file_paths[0])
             
             if not assistant_dir:
                 response.add_context("Could not find .assistant directory in parent directories.")
@@ -38,6 +38,7 @@ class TestRunner:
         print("\n--- Artifact Persistence ---")
         print(" 12. Persist artifacts (success)")
         print(" 13. Persist artifacts - file not found")
+        print(" 25. Persist artifacts - deduplicated, parallel")
         print("\n--- Markdown Processing ---")
         print(" 14. Parse markdown to dictionary (success)")
         print(" 15. Parse markdown - file not found")
@@ -45,6 +46,7 @@ class TestRunner:
         print(" 16. Update reference graph")
         print(" 17. Get references from a file")
         print(" 18. Find references to a file")
+        print(" 24. Transitive reference queries")
         print("\n--- Input Validation ---")
         print(" 19. Invalid path validation")
         print("\n--- Special Commands ---")
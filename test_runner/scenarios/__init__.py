@@ -28,6 +28,7 @@ from test_runner.scenarios.artifacts import (
     PersistArtifactsWithDeleteScenario,
     PersistArtifactsWithReferenceFixingScenario,
     PersistArtifactsWithBothOptionsScenario,
+    PersistArtifactsDedupParallelScenario,
 )
 from test_runner.scenarios.markdown import (
     MdToDictSuccessScenario,
@@ -37,6 +38,7 @@ from test_runner.scenarios.reference_graph import (
     UpdateReferenceGraphScenario,
     GetReferencesFromScenario,
     FindReferencesToScenario,
+    TransitiveReferencesScenario,
 )
 from test_runner.scenarios.validation import InvalidAbsolutePathScenario
 
@@ -66,6 +68,8 @@ SCENARIO_REGISTRY = {
     '21': PersistArtifactsWithDeleteScenario,
     '22': PersistArtifactsWithReferenceFixingScenario,
     '23': PersistArtifactsWithBothOptionsScenario,
+    '24': TransitiveReferencesScenario,
+    '25': PersistArtifactsDedupParallelScenario,
 }
 
 
@@ -258,3 +258,72 @@ class PersistArtifactsWithBothOptionsScenario(BaseScenario):
         # Cleanup
         import shutil
         shutil.rmtree(project_dir)
+
+
+class PersistArtifactsDedupParallelScenario(BaseScenario):
+    """Scenario 25: Persist identical files concurrently into the deduplicating blob store."""
+    
+    def run(self):
+        self.print_header(
+            25,
+            "Persist Artifacts - Deduplicated, Parallel",
+            "Persisting several files with identical content using multiple workers and GLYPH_ARTIFACT_DEDUP."
+        )
+        
+        # Create a fresh project directory for this test
+        import tempfile
+        project_dir = tempfile.mkdtemp(prefix="glyph_dedup_test_")
+        print(f"\nProject directory: {project_dir}")
+        
+        # Initialize assistant directory
+        from tools.init_assistant_dir import init_assistant_dir
+        init_response = init_assistant_dir(project_dir, overwrite=False)
+        print(f"Assistant directory initialized: {init_response.success}")
+        
+        # Create identical files in ad_hoc
+        ad_hoc_dir = os.path.join(project_dir, ".assistant", "ad_hoc")
+        content = "Identical content. " * 100000
+        file_names = [f"copy_{index}.txt" for index in range(8)]
+        for file_name in file_names:
+            with open(os.path.join(ad_hoc_dir, file_name), 'w') as f:
+                f.write(content)
+        
+        print(f"\nCreated {len(file_names)} identical files of {len(content)} bytes")
+        
+        print("\nCalling (with GLYPH_ARTIFACT_DEDUP enabled): persist_artifacts(")
+        print("    abs_path=project_path,")
+        print(f"    files={file_names},")
+        print("    max_workers=4")
+        print(")")
+        
+        import tools.persist_artifact as persist_artifact_module
+        dedup_before = persist_artifact_module.ARTIFACT_DEDUP
+        persist_artifact_module.ARTIFACT_DEDUP = True
+        try:
+            response = persist_artifacts(
+                project_dir,
+                file_names,
+                delete_from_ad_hoc=False,
+                fix_references=False,
+                max_workers=4
+            )
+        finally:
+            persist_artifact_module.ARTIFACT_DEDUP = dedup_before
+        
+        self.print_result("Response Object", str(response.model_dump()))
+        
+        artifacts_dir = os.path.join(project_dir, ".assistant", "artifacts")
+        artifacts = sorted(file for file in os.listdir(artifacts_dir) if file.startswith("art_"))
+        identical = 0
+        for file in artifacts:
+            with open(os.path.join(artifacts_dir, file), 'r') as f:
+                identical += f.read() == content
+        print(f"\nArtifacts with the original content: {identical} of {len(file_names)}")
+        
+        blobs_dir = os.path.join(project_dir, ".assistant", "blobs")
+        blob_files = [file for _, _, files in os.walk(blobs_dir) for file in files]
+        print(f"Files in blob store: {len(blob_files)} (leftover temporary files: {sum(file.endswith('.tmp') for file in blob_files)})")
+        
+        # Cleanup
+        import shutil
+        shutil.rmtree(project_dir)
@@ -10,7 +10,14 @@ import sys
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
-from tools.reference_graph import update_reference_graph, get_references_from, find_references_to
+from tools.reference_graph import (
+    update_reference_graph,
+    get_references_from,
+    find_references_to,
+    get_transitive_references,
+    traverse_references,
+    find_reference_path,
+)
 from tools.add_design_log import add_design_log
 from tools.add_operation import add_operation
 from tools.init_assistant_dir import init_assistant_dir
@@ -126,4 +133,49 @@ class FindReferencesToScenario(BaseScenario):
         
         response = find_references_to(ref_project, "dl_1_Core_Design.md")
         
-        self.print_result("Response Object", str(response.model_dump()))
\ No newline at end of file
+        self.print_result("Response Object", str(response.model_dump()))
+
+
+class TransitiveReferencesScenario(BaseScenario):
+    """Scenario 24: Follow chains of references across several hops."""
+    
+    def run(self):
+        self.print_header(
+            24,
+            "Transitive Reference Queries",
+            "Walking a reference chain with closure, depth-limited and shortest-path queries."
+        )
+        
+        ref_project = os.path.join(self.env.temp_dir, "ref_project4")
+        os.makedirs(ref_project)
+        init_assistant_dir(ref_project, False)
+        
+        add_design_log(ref_project, "Vision", "Top-level vision")
+        add_design_log(ref_project, "Architecture", "Architecture design")
+        add_operation(ref_project, "Build Core")
+        add_operation(ref_project, "Ship It")
+        
+        # Chain: dl_1 -> dl_2 -> op_1 -> op_2
+        dl_dir = os.path.join(ref_project, ".assistant", "design_logs")
+        op_dir = os.path.join(ref_project, ".assistant", "operations")
+        with open(os.path.join(dl_dir, "dl_1_Vision.md"), 'a') as f:
+            f.write("\n\nRealized by dl_2_Architecture.md")
+        with open(os.path.join(dl_dir, "dl_2_Architecture.md"), 'a') as f:
+            f.write("\n\nImplemented in op_1_Build_Core.md")
+        with open(os.path.join(op_dir, "op_1_Build_Core.md"), 'a') as f:
+            f.write("\n\nFollowed by op_2_Ship_It.md")
+        
+        print(f"\nProject directory: {ref_project}")
+        print("Chain: dl_1_Vision.md -> dl_2_Architecture.md -> op_1_Build_Core.md -> op_2_Ship_It.md")
+        
+        print("\nCalling: get_transitive_references(abs_path=project_path, file_name='dl_1_Vision.md')")
+        response = get_transitive_references(ref_project, "dl_1_Vision.md")
+        self.print_result("Response Object", str(response.model_dump()))
+        
+        print("\nCalling: traverse_references(abs_path=project_path, file_name='op_2_Ship_It.md', max_depth=2, direction='to')")
+        response = traverse_references(ref_project, "op_2_Ship_It.md", max_depth=2, direction="to")
+        self.print_result("Response Object", str(response.model_dump()))
+        
+        print("\nCalling: find_reference_path(abs_path=project_path, source_file='dl_1_Vision.md', target_file='op_2_Ship_It.md')")
+        response = find_reference_path(ref_project, "dl_1_Vision.md", "op_2_Ship_It.md")
+        self.print_result("Response Object", str(response.model_dump()))